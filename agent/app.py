@@ -1,21 +1,26 @@
 import os
 import re
+import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
 from dotenv import load_dotenv
-from langchain.chat_models import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
-from langchain.schema import StrOutputParser
-from langchain.schema.runnable import RunnablePassthrough
+from openai import OpenAI
 import streamlit as st
 from io import StringIO
 import sys
 import time
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
 
 # Load environment variables
@@ -26,8 +31,39 @@ console = Console()
 # Loki configuration
 LOKI_URL = os.getenv('LOKI_URL', 'http://localhost:3100')
 
-def fetch_loki_logs(time_range_minutes=60):
-    """Fetch logs from Loki for the specified time range."""
+# Shared session so repeated Loki fetches reuse pooled keep-alive connections
+_LOKI_SESSION = requests.Session()
+_LOKI_SESSION.headers.update({'Accept-Encoding': 'gzip'})
+_LOKI_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_LOKI_SESSION.mount('http://', _LOKI_ADAPTER)
+_LOKI_SESSION.mount('https://', _LOKI_ADAPTER)
+
+# Precompiled patterns used by LogAnalyzer.extract_errors
+_TRACEBACK_RE = re.compile(
+    r'Traceback \(most recent call last\):.*?(?=Traceback \(most recent call last\):|\Z)',
+    re.DOTALL
+)
+_FILE_RE = re.compile(r'File "([^"]+)"')
+_LINE_RE = re.compile(r'line (\d+)')
+# Exception type and message in one anchored pattern; the shared Error/Exception
+# suffixes let the regex compiler factor the alternation
+_ETYPE_RE = re.compile(r'([A-Za-z_.]*(?:Error|Exception)|StopIteration|KeyboardInterrupt|SystemExit):\s*(.*)')
+
+
+def _exception_match(block: str) -> Optional[re.Match]:
+    """Match the unindented `ErrorType: message` line that closes a traceback."""
+    for line in block.splitlines()[1:]:
+        if line and not line[0].isspace():
+            match = _ETYPE_RE.match(line)
+            if match:
+                return match
+    return None
+
+def fetch_loki_logs(time_range_minutes=60) -> pd.DataFrame:
+    """Fetch logs from Loki for the specified time range.
+
+    Returns a DataFrame with `timestamp` (UTC) and `message` columns.
+    """
     end_time = datetime.utcnow()
     start_time = end_time - timedelta(minutes=time_range_minutes)
     
@@ -46,167 +82,279 @@ def fetch_loki_logs(time_range_minutes=60):
     }
     
     try:
-        response = requests.get(url, params=params)
+        response = _LOKI_SESSION.get(url, params=params, timeout=5)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         if 'data' in data and 'result' in data['data']:
-            logs = []
-            for stream in data['data']['result']:
-                for value in stream['values']:
-                    timestamp, message = value
-                    logs.append({
-                        'timestamp': datetime.fromtimestamp(int(timestamp) / 1e9),
-                        'message': message
-                    })
-            return logs
-        return []
+            values = [value for stream in data['data']['result'] for value in stream['values']]
+            timestamps = [timestamp for timestamp, _ in values]
+            messages = [message for _, message in values]
+            return _loki_frame(timestamps, messages)
+        return _loki_frame([], [])
     except Exception as e:
         st.error(f"Error fetching logs from Loki: {str(e)}")
-        return []
+        return _loki_frame([], [])
+
+def _loki_frame(timestamps: List[str], messages: List[str]) -> pd.DataFrame:
+    """Convert Loki nanosecond timestamps in one vectorized call."""
+    return pd.DataFrame({
+        'timestamp': pd.to_datetime(np.asarray(timestamps, dtype=np.int64), unit='ns'),
+        'message': messages
+    })
+
+# Prompts are (role, template) pairs sent straight to the chat completions API
+ANALYSIS_PROMPT = [
+    ("system", """You are an expert software engineer and debugger. 
+    Analyze the following error and code context to provide a detailed explanation:
+    1. What is the error and why did it occur?
+    2. What is the root cause of this issue?
+    3. What is the impact of this error?
+    4. What are the potential consequences if not fixed?
+    5. What are the best practices to prevent this type of error?
+    
+    Be specific and provide actionable insights. Use clear, non-technical language where possible."""),
+    ("user", """
+    Error Context:
+    {error_context}
+    
+    Code Context:
+    {code_context}
+    
+    Please provide a detailed analysis:
+    """)
+]
+
+FIX_PROMPT = [
+    ("system", """You are an expert software engineer. 
+    Based on the error and code context, provide the BEST fix for the code.
+    Return ONLY the code that needs to be changed.
+    No explanations, no markdown formatting, just the raw code.
+    Include only the lines that need to be modified.
+    Make sure the code is properly formatted and indented.
+    Choose the most robust and maintainable solution."""),
+    ("user", """
+    Error Context:
+    {error_context}
+    
+    Original Code:
+    {code_context}
+    
+    Provide the best fix:
+    """)
+]
+
+_PROMPTS = {"analysis": ANALYSIS_PROMPT, "fix": FIX_PROMPT}
+
+LLM_MODEL = "gpt-4o"
+# Finished LLM responses kept for replay, least recently used evicted first
+COMPLETION_CACHE_MAX = 256
+
+class _CompletionCache:
+    """Thread-safe LRU of finished LLM responses, shared by every session."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[str]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: Tuple[str, str, str], value: str):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+@st.cache_resource
+def _completion_cache() -> _CompletionCache:
+    """Finished LLM responses keyed by prompt, error context and code; shared across reruns."""
+    return _CompletionCache(COMPLETION_CACHE_MAX)
+
+def error_signature(error: Dict) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Identify repeated occurrences of the same error (e.g. from a retry loop)."""
+    return (error.get('file_path'), error.get('line_number'), error.get('error_type'))
 
 class LogAnalyzer:
+    # Directories never worth descending into when indexing the project
+    INDEX_SKIP_DIRS = {'.git', '__pycache__', 'node_modules', 'venv', '.venv', '.mypy_cache', '.pytest_cache', 'dist', 'build'}
+    # Source file types a traceback can point at
+    INDEX_EXTENSIONS = ('.py', '.js', '.ts', '.jsx', '.tsx', '.java', '.go', '.rb', '.php')
+
     def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o", temperature=0)
+        self._llm: Optional[OpenAI] = None
         self.console = Console()
+        self._file_index: Optional[Dict[str, List[str]]] = None
+        # Lines of each source file read, with the (mtime, size) they were read at
+        self._lines_cache: Dict[str, Tuple[Tuple[float, int], List[str]]] = {}
+
+    @property
+    def llm(self) -> OpenAI:
+        """OpenAI client, created on first use so pages without AI analysis never pay for it."""
+        if self._llm is None:
+            self._llm = OpenAI()
+        return self._llm
 
     def extract_errors(self, log_content: str) -> List[Dict]:
         """Extract all errors from log content string."""
-        # Split log content into individual error blocks
-        error_blocks = re.split(r'(?=Traceback \(most recent call last\):)', log_content)
-        error_blocks = [block.strip() for block in error_blocks if block.strip()]
+        # Cheap substring check before running any regex
+        if 'Traceback (most recent call last):' not in log_content:
+            return []
         
         errors = []
-        for block in error_blocks:
-            # Extract error context for each block
-            error_patterns = {
-                'file_path': r'File "([^"]+)"',
-                'line_number': r'line (\d+)',
-                'error_type': r'([A-Za-z]+Error|Exception):',
-                'error_message': r'([A-Za-z]+Error|Exception):\s*(.*)',
-                'full_traceback': block
-            }
+        # Walk the traceback blocks in a single pass over the content
+        for traceback_match in _TRACEBACK_RE.finditer(log_content):
+            block = traceback_match.group(0).strip()
+            
+            # Blocks without a file reference can never be reported
+            if 'File "' not in block:
+                continue
             
+            # Extract error context for each block
             context = {}
-            for key, pattern in error_patterns.items():
-                if key == 'full_traceback':
-                    context[key] = block
-                else:
-                    match = re.search(pattern, block)
-                    if match:
-                        context[key] = match.group(1)
+            match = _FILE_RE.search(block)
+            if match:
+                context['file_path'] = match.group(1)
+            match = _LINE_RE.search(block)
+            if match:
+                context['line_number'] = match.group(1)
+            if 'Error' in block or 'Exception' in block:
+                # Match anchored on the exception line rather than scanning the whole block
+                match = _exception_match(block)
+                if match:
+                    context['error_type'] = match.group(1)
+                    context['error_message'] = match.group(2)
+            context['full_traceback'] = block
             
             if context.get('file_path') and context.get('line_number'):
                 errors.append(context)
         
         return errors
 
+    def unique_errors(self, errors: List[Dict]) -> List[Dict]:
+        """Group errors by signature, keeping the first occurrence and the indices of all of them."""
+        groups: Dict[Tuple, Dict] = {}
+        for i, error in enumerate(errors):
+            group = groups.setdefault(error_signature(error), {'error': error, 'count': 0, 'indices': []})
+            group['count'] += 1
+            group['indices'].append(i)
+        return list(groups.values())
+
     def find_file(self, file_path: str) -> Optional[str]:
         """Find file in the project structure."""
         # First try the exact path
         if os.path.exists(file_path):
             return file_path
             
-        # If not found, search in the project directory
-        project_root = os.getcwd()
-        for root, _, files in os.walk(project_root):
-            for file in files:
-                if file == os.path.basename(file_path):
-                    return os.path.join(root, file)
-        return None
+        # If not found, look it up in the project index (built on first use)
+        if self._file_index is None:
+            self._file_index = self._build_file_index(os.getcwd())
+        return self._file_index.get(os.path.basename(file_path), [None])[0]
+
+    def _build_file_index(self, project_root: str) -> Dict[str, List[str]]:
+        """Map each source file name under project_root to the paths where it occurs."""
+        index: Dict[str, List[str]] = {}
+        stack = [project_root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.INDEX_SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(self.INDEX_EXTENSIONS) and entry.is_file():
+                    index.setdefault(entry.name, []).append(entry.path)
+        return index
 
     def get_relevant_code(self, file_path: str, line_number: int, context_lines: int = 5) -> Dict:
         """Get relevant code around the error line."""
+        # Several errors in one file share a read; a changed mtime or size forces a re-read
         try:
-            with open(file_path, 'r') as f:
-                lines = f.readlines()
-            
-            start = max(0, line_number - context_lines - 1)
-            end = min(len(lines), line_number + context_lines)
-            
-            relevant_code = ''.join(lines[start:end])
-            return {
-                'code': relevant_code,
-                'start_line': start,
-                'end_line': end,
-                'full_content': ''.join(lines)
-            }
+            stat = os.stat(file_path)
+            stamp = (stat.st_mtime, stat.st_size)
+            cached = self._lines_cache.get(file_path)
+            if cached is not None and cached[0] == stamp:
+                lines = cached[1]
+            else:
+                with open(file_path, 'r') as f:
+                    lines = f.readlines()
+                self._lines_cache[file_path] = (stamp, lines)
         except Exception as e:
             return {'error': f"Could not read file: {str(e)}"}
+        
+        start = max(0, line_number - context_lines - 1)
+        end = min(len(lines), line_number + context_lines)
+        
+        return {
+            'code': ''.join(lines[start:end]),
+            'start_line': start,
+            'end_line': end,
+            'lines': lines
+        }
+
+    def apply_fix(self, file_path: str, lines: List[str], fix_content: str, start_line: int, end_line: int) -> bool:
+        """Apply the fix to the specific part of the file.
 
-    def apply_fix(self, file_path: str, original_content: str, fix_content: str, start_line: int, end_line: int) -> bool:
-        """Apply the fix to the specific part of the file."""
+        `lines` is the line list returned by get_relevant_code; it is left unchanged.
+        """
         try:
-            lines = original_content.split('\n')
-            new_lines = lines[:start_line] + fix_content.split('\n') + lines[end_line:]
+            new_lines = lines[:start_line] + [line + '\n' for line in fix_content.split('\n')] + lines[end_line:]
             with open(file_path, 'w') as f:
-                f.write('\n'.join(new_lines))
+                f.writelines(new_lines)
+            # Cache the new lines only once they are on disk
+            stat = os.stat(file_path)
+            self._lines_cache[file_path] = ((stat.st_mtime, stat.st_size), new_lines)
             return True
         except Exception as e:
             console.print(f"[red]Error applying fix: {str(e)}[/red]")
             return False
 
-    def get_error_analysis(self, error_context: Dict, code_context: Dict) -> str:
-        """Get detailed analysis of the error."""
-        analysis_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an expert software engineer and debugger. 
-            Analyze the following error and code context to provide a detailed explanation:
-            1. What is the error and why did it occur?
-            2. What is the root cause of this issue?
-            3. What is the impact of this error?
-            4. What are the potential consequences if not fixed?
-            5. What are the best practices to prevent this type of error?
-            
-            Be specific and provide actionable insights. Use clear, non-technical language where possible."""),
-            ("user", """
-            Error Context:
-            {error_context}
-            
-            Code Context:
-            {code_context}
-            
-            Please provide a detailed analysis:
-            """)
-        ])
-
-        analysis_chain = (
-            {"error_context": lambda x: str(error_context), "code_context": lambda x: code_context['code']}
-            | analysis_prompt
-            | self.llm
-            | StrOutputParser()
+    def stream_completion(self, prompt_name: str, error_context: Dict, code_context: Dict) -> Iterator[str]:
+        """Stream the response to one of the prompts, or replay it if already generated."""
+        cache = _completion_cache()
+        # Keyed by exactly what the prompt is built from, so a cached answer is
+        # only replayed for the same error, message included
+        error_json = json.dumps(error_context, sort_keys=True)
+        key = (prompt_name, error_json, code_context['code'])
+        cached = cache.get(key)
+        if cached is not None:
+            return iter([cached])
+        return self._stream_and_cache(cache, key)
+
+    def _stream_and_cache(self, cache: _CompletionCache, key: Tuple[str, str, str]) -> Iterator[str]:
+        """Yield response chunks as they arrive and store the full text once complete."""
+        prompt_name, error_json, code = key
+        messages = [
+            {"role": role, "content": template.format(error_context=error_json, code_context=code)}
+            for role, template in _PROMPTS[prompt_name]
+        ]
+        stream = self.llm.chat.completions.create(
+            model=LLM_MODEL, temperature=0, messages=messages, stream=True
         )
+        chunks = []
+        for chunk in stream:
+            content = chunk.choices[0].delta.content if chunk.choices else None
+            if content:
+                chunks.append(content)
+                yield content
+        cache.put(key, ''.join(chunks))
 
-        return analysis_chain.invoke({})
+    def get_error_analysis(self, error_context: Dict, code_context: Dict) -> str:
+        """Get detailed analysis of the error."""
+        return ''.join(self.stream_completion("analysis", error_context, code_context))
 
     def get_fix(self, error_context: Dict, code_context: Dict) -> str:
         """Get the best fix for the error."""
-        fix_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an expert software engineer. 
-            Based on the error and code context, provide the BEST fix for the code.
-            Return ONLY the code that needs to be changed.
-            No explanations, no markdown formatting, just the raw code.
-            Include only the lines that need to be modified.
-            Make sure the code is properly formatted and indented.
-            Choose the most robust and maintainable solution."""),
-            ("user", """
-            Error Context:
-            {error_context}
-            
-            Original Code:
-            {code_context}
-            
-            Provide the best fix:
-            """)
-        ])
-
-        fix_chain = (
-            {"error_context": lambda x: str(error_context), "code_context": lambda x: code_context['code']}
-            | fix_prompt
-            | self.llm
-            | StrOutputParser()
-        )
-
-        return fix_chain.invoke({})
+        return ''.join(self.stream_completion("fix", error_context, code_context))
 
 # --- Page Config ---
 st.set_page_config(
@@ -233,10 +381,12 @@ if 'analyzer' not in st.session_state:
     st.session_state.analyzer = LogAnalyzer()
 if 'errors' not in st.session_state:
     st.session_state.errors = []
+if 'unique_errors' not in st.session_state:
+    st.session_state.unique_errors = []
 if 'selected_error_index' not in st.session_state:
     st.session_state.selected_error_index = None
-if 'resolutions' not in st.session_state:
-    st.session_state.resolutions = {}  # Store resolution status for each error
+if 'error_df' not in st.session_state:
+    st.session_state.error_df = None  # Error table with the resolution status of each error
 
 # --- Sidebar ---
 st.sidebar.title("LogAnalytics")
@@ -259,27 +409,32 @@ page = st.sidebar.radio(
 )
 
 # --- Helper Functions ---
+@st.cache_data(show_spinner=False)
+def extract_errors_cached(_analyzer, content: bytes) -> List[Dict]:
+    """Extract errors from the raw upload, memoized on the file content."""
+    return _analyzer.extract_errors(content.decode("utf-8"))
+
 def process_uploaded_file():
     """Process the uploaded log file and extract errors."""
     if uploaded_file is not None:
         try:
-            # Read file content
-            content = uploaded_file.getvalue().decode("utf-8")
-            
             with st.spinner("Analyzing log file..."):
-                # Extract errors using the analyzer
-                extracted_errors = st.session_state.analyzer.extract_errors(content)
+                # Extract errors using the analyzer (cached on the file content)
+                extracted_errors = extract_errors_cached(
+                    st.session_state.analyzer, uploaded_file.getvalue()
+                )
                 
                 # Store errors in session state
                 st.session_state.errors = extracted_errors
+                st.session_state.unique_errors = st.session_state.analyzer.unique_errors(extracted_errors)
                 
-                # Initialize resolution status for new errors
-                for i, error in enumerate(extracted_errors):
-                    if i not in st.session_state.resolutions:
-                        st.session_state.resolutions[i] = {
-                            'status': 'Pending',
-                            'error': error
-                        }
+                # Build the error table once; reruns only touch its Status column
+                error_df = build_error_df(extracted_errors)
+                previous_df = st.session_state.error_df
+                if previous_df is not None:
+                    # Keep the status already assigned to errors at the same position
+                    error_df['Status'] = previous_df['Status'].reindex(error_df.index).fillna('Pending')
+                st.session_state.error_df = error_df
                 
                 return True
         except Exception as e:
@@ -287,12 +442,24 @@ def process_uploaded_file():
             return False
     return False
 
+def build_error_df(errors: List[Dict]) -> pd.DataFrame:
+    """Build the error table shown on the Dashboard and Resolutions pages."""
+    return pd.DataFrame({
+        "ID": range(len(errors)),
+        "Status": "Pending",
+        "Type": [error.get('error_type', 'Unknown') for error in errors],
+        "File": [error.get('file_path', 'Unknown') for error in errors],
+        "Line": [error.get('line_number', 'Unknown') for error in errors],
+        "Message": [error.get('error_message', 'No message') for error in errors]
+    })
+
 def display_error_metrics():
     """Display error metrics in the dashboard."""
     total_errors = len(st.session_state.errors)
-    resolved = sum(1 for res in st.session_state.resolutions.values() if res['status'] == 'Applied')
-    pending = sum(1 for res in st.session_state.resolutions.values() if res['status'] == 'Pending')
-    dismissed = sum(1 for res in st.session_state.resolutions.values() if res['status'] == 'Dismissed')
+    status_counts = st.session_state.error_df['Status'].value_counts()
+    resolved = int(status_counts.get('Applied', 0))
+    pending = int(status_counts.get('Pending', 0))
+    dismissed = int(status_counts.get('Dismissed', 0))
     
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("Total Errors", total_errors)
@@ -300,29 +467,16 @@ def display_error_metrics():
     col3.metric("Pending", pending)
     col4.metric("Dismissed", dismissed)
 
-def display_error_table(errors: List[Dict]):
+def display_error_table(error_df: pd.DataFrame):
     """Display a table of errors with their details."""
-    if not errors:
+    if error_df is None or error_df.empty:
         st.info("No errors found in the log file.")
         return
     
-    # Create a list of dictionaries for the dataframe
-    error_data = []
-    for i, error in enumerate(errors):
-        status = st.session_state.resolutions.get(i, {}).get('status', 'Pending')
-        error_data.append({
-            "ID": i,
-            "Status": status,
-            "Type": error.get('error_type', 'Unknown'),
-            "File": error.get('file_path', 'Unknown'),
-            "Line": error.get('line_number', 'Unknown'),
-            "Message": error.get('error_message', 'No message')
-        })
-    
-    st.dataframe(error_data, use_container_width=True)
+    st.dataframe(error_df, use_container_width=True, hide_index=True)
 
 def get_error_details(error: Dict):
-    """Get detailed analysis and fix for an error."""
+    """Show the relevant code and stream the analysis for an error, then return its fix."""
     file_path = st.session_state.analyzer.find_file(error['file_path'])
     if not file_path:
         st.warning(f"Could not locate file: {error['file_path']}")
@@ -338,11 +492,24 @@ def get_error_details(error: Dict):
             st.warning(f"Error getting code context: {code_context['error']}")
             return None, None, None
         
-        with st.spinner("Generating analysis..."):
-            analysis = st.session_state.analyzer.get_error_analysis(error, code_context)
+        # Show relevant code
+        st.subheader("Relevant Code")
+        st.code(code_context['code'], language="python")
         
-        with st.spinner("Generating fix..."):
-            fix = st.session_state.analyzer.get_fix(error, code_context)
+        analyzer = st.session_state.analyzer
+        pool = ThreadPoolExecutor(max_workers=1)
+        try:
+            # Generate the fix in the background while the analysis streams in
+            fix_future = pool.submit(''.join, analyzer.stream_completion("fix", error, code_context))
+            
+            st.subheader("AI Analysis")
+            analysis = st.write_stream(analyzer.stream_completion("analysis", error, code_context))
+            
+            with st.spinner("Generating fix..."):
+                fix = fix_future.result()
+        finally:
+            # A rerun or stop mid-stream shouldn't block the script on the fix call
+            pool.shutdown(wait=False, cancel_futures=True)
         
         return code_context, analysis, fix
     except Exception as e:
@@ -365,7 +532,7 @@ if page == "Dashboard":
             
             # Display error table
             st.subheader("Error Overview")
-            display_error_table(st.session_state.errors)
+            display_error_table(st.session_state.error_df)
             
             # Add a refresh button
             if st.button("Refresh Analysis"):
@@ -378,10 +545,11 @@ elif page == "Error Analysis":
     if not st.session_state.errors:
         st.info("No errors to analyze. Please upload a log file first.")
     else:
-        # Error selection
+        # Error selection, one entry per distinct error
         error_options = {
-            f"Error {i} ({err.get('error_type', 'Unknown')} in {os.path.basename(err.get('file_path', 'Unknown'))})": i 
-            for i, err in enumerate(st.session_state.errors)
+            f"Error {group['indices'][0]} ({group['error'].get('error_type', 'Unknown')} in "
+            f"{os.path.basename(group['error'].get('file_path', 'Unknown'))}) - {group['count']} occurrence(s)": group
+            for group in st.session_state.unique_errors
         }
         
         selected = st.selectbox(
@@ -390,8 +558,9 @@ elif page == "Error Analysis":
         )
         
         if selected:
-            error_index = error_options[selected]
-            error = st.session_state.errors[error_index]
+            group = error_options[selected]
+            error = group['error']
+            error_index = group['indices'][0]
             
             # Display error details
             st.subheader("Error Details")
@@ -401,7 +570,7 @@ elif page == "Error Analysis":
                 st.write(f"**File:** {error.get('file_path', 'Unknown')}")
             with col2:
                 st.write(f"**Line:** {error.get('line_number', 'Unknown')}")
-                st.write(f"**Status:** {st.session_state.resolutions.get(error_index, {}).get('status', 'Pending')}")
+                st.write(f"**Status:** {st.session_state.error_df.at[error_index, 'Status']}")
             
             # Show full traceback in expander
             with st.expander("Show Full Traceback"):
@@ -411,14 +580,6 @@ elif page == "Error Analysis":
             code_context, analysis, fix = get_error_details(error)
             
             if code_context and analysis and fix:
-                # Show relevant code
-                st.subheader("Relevant Code")
-                st.code(code_context['code'], language="python")
-                
-                # Show analysis
-                st.subheader("AI Analysis")
-                st.markdown(analysis)
-                
                 # Show fix
                 st.subheader("Suggested Fix")
                 st.code(fix, language="python")
@@ -427,15 +588,15 @@ elif page == "Error Analysis":
                 col1, col2, col3 = st.columns(3)
                 with col1:
                     if st.button("Apply Fix", key=f"apply_{error_index}"):
-                        st.session_state.resolutions[error_index]['status'] = 'Applied'
+                        st.session_state.error_df.loc[group['indices'], 'Status'] = 'Applied'
                         st.success("Fix marked as applied!")
                 with col2:
                     if st.button("Dismiss", key=f"dismiss_{error_index}"):
-                        st.session_state.resolutions[error_index]['status'] = 'Dismissed'
+                        st.session_state.error_df.loc[group['indices'], 'Status'] = 'Dismissed'
                         st.info("Error marked as dismissed.")
                 with col3:
                     if st.button("Reset Status", key=f"reset_{error_index}"):
-                        st.session_state.resolutions[error_index]['status'] = 'Pending'
+                        st.session_state.error_df.loc[group['indices'], 'Status'] = 'Pending'
                         st.info("Status reset to pending.")
 
 elif page == "Resolutions":
@@ -452,21 +613,12 @@ elif page == "Resolutions":
         # Display resolutions table
         st.subheader("Resolution Status")
         
-        resolution_data = []
-        for i, res_info in st.session_state.resolutions.items():
-            if status_filter == "All" or res_info['status'] == status_filter:
-                error = res_info['error']
-                resolution_data.append({
-                    "ID": i,
-                    "Status": res_info['status'],
-                    "Type": error.get('error_type', 'Unknown'),
-                    "File": error.get('file_path', 'Unknown'),
-                    "Line": error.get('line_number', 'Unknown'),
-                    "Message": error.get('error_message', 'No message')
-                })
+        resolution_df = st.session_state.error_df
+        if status_filter != "All":
+            resolution_df = resolution_df[resolution_df['Status'] == status_filter]
         
-        if resolution_data:
-            st.dataframe(resolution_data, use_container_width=True)
+        if not resolution_df.empty:
+            st.dataframe(resolution_df, use_container_width=True, hide_index=True)
         else:
             st.info(f"No errors with status: {status_filter}")
 
@@ -489,14 +641,12 @@ elif page == "Loki Logs":
     # Fetch and display logs
     logs = fetch_loki_logs(time_range)
     
-    if logs:
-        # Create a container for the logs
-        log_container = st.container()
-        
-        # Display logs in reverse chronological order
-        for log in reversed(logs):
-            with log_container:
-                st.text(f"{log['timestamp']}: {log['message']}")
+    if not logs.empty:
+        # Display logs in reverse chronological order as a single element
+        body = '\n'.join(
+            f"{log.timestamp}: {log.message}" for log in logs.iloc[::-1].itertuples(index=False)
+        )
+        st.code(body, language=None)
     else:
         st.info("No logs found in the selected time range.")
 
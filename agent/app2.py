@@ -1,33 +1,31 @@
 import os
 import re
 from pathlib import Path
-from typing import List, Dict, Optional, Counter
+from typing import List, Dict, Iterator, Optional, Tuple
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
 from dotenv import load_dotenv
-from langchain.chat_models import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate
-from langchain.schema import StrOutputParser
-from langchain.schema.runnable import RunnablePassthrough
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
+import streamlit.components.v1 as components
 from io import StringIO
 import sys
 import time
-from collections import defaultdict
-import hashlib
-import requests
+import asyncio
+import base64
+import json
+from collections import Counter, OrderedDict, defaultdict
+from itertools import islice
 from datetime import datetime, timedelta
 
 # Load environment variables
 load_dotenv()
 
+# langchain, plotly, pandas, numpy, requests and ijson are imported inside the
+# functions and pages that use them so pages that never need them don't pay
+# for the import
+
 # Initialize session state for Loki configuration
 if 'loki_config' not in st.session_state:
     st.session_state.loki_config = {
@@ -40,45 +38,106 @@ if 'loki_config' not in st.session_state:
 
 console = Console()
 
+# Analysis/fix results kept per session, least recently used evicted first
+ANALYSIS_CACHE_MAX = 4
+
+# Section headings in the combined analysis/fixes response, in any case and as
+# a markdown heading ("## FIXES", "### Fixes:") or a bold line ("**FIXES**")
+def _section_heading_re(name: str) -> re.Pattern:
+    return re.compile(
+        r'^[ \t]*(?:#{1,6}[ \t]*(?:\*\*)?|\*\*)[ \t]*' + name + r'[ \t]*:?[ \t]*(?:\*\*)?[ \t]*:?[ \t]*$',
+        re.IGNORECASE | re.MULTILINE
+    )
+
+_ANALYSIS_HEADING_RE = _section_heading_re('analysis')
+_FIXES_HEADING_RE = _section_heading_re('fixes')
+
+# Inline preview for the empty dashboard, so first paint needs no external image request
+_SAMPLE_DASHBOARD_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="800" height="400" viewBox="0 0 800 400">
+<rect width="800" height="400" fill="#f0f2f6"/>
+<g fill="#ffffff" stroke="#dedede">
+<rect x="40" y="30" width="160" height="70" rx="10"/><rect x="230" y="30" width="160" height="70" rx="10"/>
+<rect x="420" y="30" width="160" height="70" rx="10"/><rect x="610" y="30" width="150" height="70" rx="10"/>
+<rect x="40" y="130" width="720" height="240" rx="10"/>
+</g>
+<g fill="#0d6efd">
+<rect x="90" y="290" width="60" height="60"/><rect x="190" y="230" width="60" height="120"/>
+<rect x="290" y="260" width="60" height="90"/><rect x="390" y="180" width="60" height="170"/>
+<rect x="490" y="300" width="60" height="50"/><rect x="590" y="250" width="60" height="100"/>
+</g>
+<text x="400" y="160" font-family="sans-serif" font-size="20" fill="#666" text-anchor="middle">Sample Error Dashboard</text>
+</svg>"""
+SAMPLE_DASHBOARD_IMG = (
+    '<img style="width: 100%;" alt="Sample Error Dashboard" '
+    f'src="data:image/svg+xml;base64,{base64.b64encode(_SAMPLE_DASHBOARD_SVG.encode()).decode()}">'
+)
+
+# Precompiled patterns for error extraction and grouping
+_TRACEBACK_HEADER = 'Traceback (most recent call last):'
+# File path, line number and error type/message in one alternation, so each
+# block is scanned once
+_ERR_FIELDS = re.compile(
+    r'File "(?P<file>[^"]+)"'
+    r'|line (?P<line>\d+)'
+    r'|(?P<etype>[A-Za-z]+Error|Exception):\s*(?P<emsg>[^\n]*)'
+)
+_QUOTE1_RE = re.compile(r"'[^']*'")
+_QUOTE2_RE = re.compile(r'"[^"]*"')
+_NUM_RE = re.compile(r'\b\d+\b')
+
+def _iter_traceback_blocks(log_content: str) -> Iterator[str]:
+    """Yield each traceback block, locating headers with plain substring search."""
+    start = log_content.find(_TRACEBACK_HEADER)
+    while start != -1:
+        next_start = log_content.find(_TRACEBACK_HEADER, start + len(_TRACEBACK_HEADER))
+        yield log_content[start:next_start if next_start != -1 else len(log_content)]
+        start = next_start
+
+def _parse_block(block: str) -> Optional[Dict]:
+    """Parse one traceback block into an error context, or None if it has no location."""
+    block = block.strip()
+    
+    # Extract error context for the block
+    context = {}
+    for match in _ERR_FIELDS.finditer(block):
+        # Keep the first occurrence of each field
+        if match.group('file') is not None:
+            context.setdefault('file_path', match.group('file'))
+        elif match.group('line') is not None:
+            context.setdefault('line_number', match.group('line'))
+        elif 'error_type' not in context:
+            error_type, error_message = match.group('etype', 'emsg')
+            context['error_type'] = error_type
+            # For error_message, we need both the type and the message
+            if error_message:
+                context['error_message'] = f"{error_type}: {error_message.strip()}"
+            else:
+                context['error_message'] = error_type
+        if len(context) == 4:
+            break
+    context['full_traceback'] = block
+    
+    # Classify the block once at ingest so the dashboard can compare a field
+    block_upper = block.upper()
+    context['level'] = 'error' if 'ERROR' in block_upper else \
+                       'warning' if 'WARNING' in block_upper else 'info'
+    
+    if context.get('file_path') and context.get('line_number'):
+        return context
+    return None
+
 class EnhancedLogAnalyzer:
     def __init__(self):
+        from langchain.chat_models import ChatOpenAI
         self.llm = ChatOpenAI(model="gpt-4o", temperature=0)
         self.console = Console()
+        self._file_index: Optional[Dict[str, List[str]]] = None
 
     def extract_errors(self, log_content: str) -> List[Dict]:
         """Extract all errors from log content string."""
-        # Split log content into individual error blocks
-        error_blocks = re.split(r'(?=Traceback \(most recent call last\):)', log_content)
-        error_blocks = [block.strip() for block in error_blocks if block.strip()]
-        
-        errors = []
-        for block in error_blocks:
-            # Extract error context for each block
-            error_patterns = {
-                'file_path': r'File "([^"]+)"',
-                'line_number': r'line (\d+)',
-                'error_type': r'([A-Za-z]+Error|Exception):',
-                'error_message': r'([A-Za-z]+Error|Exception):\s*(.*)',
-                'full_traceback': block
-            }
-            
-            context = {}
-            for key, pattern in error_patterns.items():
-                if key == 'full_traceback':
-                    context[key] = block
-                else:
-                    match = re.search(pattern, block)
-                    if match:
-                        # For error_message, we need to get both groups
-                        if key == 'error_message' and match.group(2):
-                            context[key] = f"{match.group(1)}: {match.group(2).strip()}"
-                        else:
-                            context[key] = match.group(1)
-            
-            if context.get('file_path') and context.get('line_number'):
-                errors.append(context)
-        
-        return errors
+        # Blocks are independent, so parsing is a plain map over them
+        parsed = map(_parse_block, _iter_traceback_blocks(log_content))
+        return [context for context in parsed if context is not None]
 
     def group_similar_errors(self, errors: List[Dict]) -> Dict[str, List[Dict]]:
         """Group similar errors together based on error type and message pattern."""
@@ -86,23 +145,28 @@ class EnhancedLogAnalyzer:
             return {}
             
         error_groups = defaultdict(list)
+        # Logs repeat the same message many times; normalize each distinct one once
+        signatures: Dict[tuple, str] = {}
         
         for error in errors:
             # Create a signature for the error based on type and message pattern
             error_type = error.get('error_type', 'Unknown')
             error_message = error.get('error_message', '')
             
-            # Extract the core part of the message without specific variables
-            # This helps group similar errors with different variable values
-            core_message = re.sub(r"'[^']*'", "'VARIABLE'", error_message)
-            core_message = re.sub(r'"[^"]*"', '"VARIABLE"', core_message)
-            core_message = re.sub(r'\b\d+\b', 'NUMBER', core_message)
-            
-            # Create a unique signature that represents this error pattern
-            signature = f"{error_type}:{core_message}"
-            signature_hash = hashlib.md5(signature.encode()).hexdigest()
+            signature = signatures.get((error_type, error_message))
+            if signature is None:
+                # Extract the core part of the message without specific variables
+                # This helps group similar errors with different variable values
+                core_message = _QUOTE1_RE.sub("'VARIABLE'", error_message)
+                core_message = _QUOTE2_RE.sub('"VARIABLE"', core_message)
+                core_message = _NUM_RE.sub('NUMBER', core_message)
+                
+                # Create a unique signature that represents this error pattern;
+                # the string itself is the group key
+                signature = f"{error_type}:{core_message}"
+                signatures[(error_type, error_message)] = signature
             
-            error_groups[signature_hash].append(error)
+            error_groups[signature].append(error)
         
         return error_groups
 
@@ -119,8 +183,14 @@ class EnhancedLogAnalyzer:
             file_paths = [e.get('file_path', 'Unknown') for e in errors]
             line_numbers = [e.get('line_number', '0') for e in errors]
             
-            # Get the most common files affected
-            common_files = pd.Series(file_paths).value_counts().head(3).to_dict()
+            # Get the most common files affected, highest count first
+            top_files = Counter(file_paths).most_common(3)
+            common_files = dict(top_files)
+            
+            # Basenames for the charts; distinct paths sharing a basename are summed
+            common_files_basenames = Counter()
+            for file, count in common_files.items():
+                common_files_basenames[os.path.basename(file)] += count
             
             # Create insight for this error group
             insight = {
@@ -129,6 +199,8 @@ class EnhancedLogAnalyzer:
                 'count': len(errors),
                 'representative_error': representative,
                 'common_files': common_files,
+                'common_files_basenames': dict(common_files_basenames),
+                'top_file': top_files[0][0] if top_files else 'N/A',
                 'errors': errors
             }
             
@@ -143,7 +215,19 @@ class EnhancedLogAnalyzer:
         """Get comprehensive analysis of all error patterns."""
         if not error_patterns:
             return "No errors found to analyze."
-            
+        return self._analysis_chain(error_patterns).invoke({})
+
+    async def aget_comprehensive_analysis(self, error_patterns: List[Dict]) -> str:
+        """Async variant of get_comprehensive_analysis."""
+        if not error_patterns:
+            return "No errors found to analyze."
+        return await self._analysis_chain(error_patterns).ainvoke({})
+
+    def _analysis_chain(self, error_patterns: List[Dict]):
+        """Build the comprehensive analysis chain for the given error patterns."""
+        from langchain.prompts import ChatPromptTemplate
+        from langchain.schema import StrOutputParser
+        
         # Create a summary of all error patterns for the LLM to analyze
         error_summary = []
         for i, pattern in enumerate(error_patterns, 1):
@@ -184,13 +268,29 @@ class EnhancedLogAnalyzer:
             | StrOutputParser()
         )
 
-        return analysis_chain.invoke({})
+        return analysis_chain
 
     def get_unified_fix_recommendations(self, error_patterns: List[Dict]) -> str:
         """Get unified fix recommendations for all error patterns."""
         if not error_patterns:
             return "No errors found to fix."
-            
+        return self._fix_chain(error_patterns).invoke({})
+
+    async def aget_unified_fix_recommendations(self, error_patterns: List[Dict]) -> str:
+        """Async variant of get_unified_fix_recommendations."""
+        if not error_patterns:
+            return "No errors found to fix."
+        return await self._fix_chain(error_patterns).ainvoke({})
+
+    def stream_unified_fix_recommendations(self, error_patterns: List[Dict]) -> Iterator[str]:
+        """Stream the unified fix recommendations as they are generated."""
+        return self._fix_chain(error_patterns).stream({})
+
+    def _fix_chain(self, error_patterns: List[Dict]):
+        """Build the unified fix recommendation chain for the given error patterns."""
+        from langchain.prompts import ChatPromptTemplate
+        from langchain.schema import StrOutputParser
+        
         # Create a summary of top error patterns for the LLM to fix
         top_patterns = error_patterns[:3]  # Focus on the top 3 most frequent patterns
         
@@ -233,7 +333,107 @@ class EnhancedLogAnalyzer:
             | StrOutputParser()
         )
 
-        return fix_chain.invoke({})
+        return fix_chain
+
+    def get_analysis_and_fixes_concurrently(self, error_patterns: List[Dict]) -> Tuple[str, str]:
+        """Run the dedicated analysis and fix prompts with both requests in flight at once."""
+        async def gather():
+            return await asyncio.gather(
+                self.aget_comprehensive_analysis(error_patterns),
+                self.aget_unified_fix_recommendations(error_patterns)
+            )
+        analysis, fixes = asyncio.run(gather())
+        return analysis, fixes
+
+    def get_combined_analysis_and_fixes(self, error_patterns: List[Dict]) -> Tuple[str, str]:
+        """Get the comprehensive analysis and the fix recommendations from a single LLM call."""
+        if not error_patterns:
+            return "No errors found to analyze.", "No errors found to fix."
+        return self.parse_combined_response(error_patterns, self._combined_chain(error_patterns).invoke({}))
+
+    def stream_combined_analysis_and_fixes(self, error_patterns: List[Dict]) -> Iterator[str]:
+        """Stream the combined analysis/fixes response as it is generated.
+
+        Pass the accumulated text to parse_combined_response once the stream is exhausted.
+        """
+        return self._combined_chain(error_patterns).stream({})
+
+    def _combined_chain(self, error_patterns: List[Dict]):
+        """Build the combined analysis and fix recommendation chain."""
+        from langchain.prompts import ChatPromptTemplate
+        from langchain.schema import StrOutputParser
+        
+        # Summarize every pattern once; the fix section is asked to focus on the top 3
+        error_summary = []
+        for i, pattern in enumerate(error_patterns, 1):
+            representative = pattern['representative_error']
+            error_summary.append(f"Pattern {i} (Occurs {pattern['count']} times):")
+            error_summary.append(f"- Error Type: {pattern['error_type']}")
+            error_summary.append(f"- Common Files Affected: {', '.join(list(pattern['common_files'].keys())[:3])}")
+            error_summary.append(f"- Representative Error Message: {representative.get('error_message', 'No message')}")
+            error_summary.append(f"- Representative Traceback: {representative.get('full_traceback', '')[:500]}...")
+            error_summary.append("")
+        
+        error_summary_text = "\n".join(error_summary)
+        
+        combined_prompt = ChatPromptTemplate.from_messages([
+            ("system", """You are an expert software error analyst and engineer skilled at identifying patterns across multiple errors and fixing systemic bugs.
+            Your response must contain exactly two sections, each starting with its heading on its own line:
+            
+            ## ANALYSIS
+            A comprehensive summary of the error patterns:
+            1. Identify the root causes of each error pattern
+            2. Explain potential connections between different error patterns
+            3. Identify which errors are likely causing other errors (cascading failures)
+            4. Prioritize which errors should be fixed first and why
+            5. Provide a high-level plan for resolving all identified issues
+            Focus on systemic issues rather than individual error instances.
+            
+            ## FIXES
+            Practical fix recommendations for the top 3 most frequent patterns. For each pattern:
+            1. Explain the root cause
+            2. Provide a specific code-level fix recommendation
+            3. Suggest preventive measures to avoid similar issues in the future
+            Address the underlying issues rather than just the symptoms, with code examples where appropriate.
+            
+            Be concise but thorough."""),
+            ("user", """
+            Here are the error patterns identified in the log file:
+            
+            {error_summary}
+            
+            Please provide the analysis and the fix recommendations:
+            """)
+        ])
+
+        combined_chain = (
+            {"error_summary": lambda x: error_summary_text}
+            | combined_prompt
+            | self.llm
+            | StrOutputParser()
+        )
+
+        return combined_chain
+
+    def parse_combined_response(self, error_patterns: List[Dict], response: str) -> Tuple[str, str]:
+        """Split a combined response into the analysis and the fix recommendations."""
+        analysis, fixes = self.split_combined_response(response)
+        if fixes is None:
+            # The model ignored the format; keep its text as the analysis and
+            # ask the dedicated prompt for the fixes only
+            fixes = self.get_unified_fix_recommendations(error_patterns)
+        return analysis, fixes
+
+    @staticmethod
+    def split_combined_response(response: str) -> Tuple[str, Optional[str]]:
+        """Split a combined response into its analysis and fixes sections.
+
+        Without a fixes heading the whole response is the analysis and fixes is None.
+        """
+        match = _FIXES_HEADING_RE.search(response)
+        head = response if match is None else response[:match.start()]
+        analysis = _ANALYSIS_HEADING_RE.sub('', head, count=1).strip()
+        return analysis, None if match is None else response[match.end():].strip()
 
     def find_file(self, file_path: str) -> Optional[str]:
         """Find file in the project structure."""
@@ -241,29 +441,40 @@ class EnhancedLogAnalyzer:
         if os.path.exists(file_path):
             return file_path
             
-        # If not found, search in the project directory
-        project_root = os.getcwd()
-        for root, _, files in os.walk(project_root):
-            for file in files:
-                if file == os.path.basename(file_path):
-                    return os.path.join(root, file)
-        return None
+        # If not found, look it up in the project index (built on first use)
+        if self._file_index is None:
+            self._file_index = self._build_file_index(os.getcwd())
+        return self._file_index.get(os.path.basename(file_path), [None])[0]
+
+    def _build_file_index(self, project_root: str) -> Dict[str, List[str]]:
+        """Map every file name under project_root to the paths where it occurs."""
+        index: Dict[str, List[str]] = {}
+        stack = [project_root]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    index.setdefault(entry.name, []).append(entry.path)
+        return index
 
     def get_relevant_code(self, file_path: str, line_number: int, context_lines: int = 5) -> Dict:
         """Get relevant code around the error line."""
         try:
-            with open(file_path, 'r') as f:
-                lines = f.readlines()
-            
             start = max(0, line_number - context_lines - 1)
-            end = min(len(lines), line_number + context_lines)
+            # Read only the window around the error line
+            with open(file_path, 'r') as f:
+                window = list(islice(f, start, line_number + context_lines))
             
-            relevant_code = ''.join(lines[start:end])
             return {
-                'code': relevant_code,
+                'code': ''.join(window),
                 'start_line': start,
-                'end_line': end,
-                'full_content': ''.join(lines)
+                'end_line': start + len(window)
             }
         except Exception as e:
             return {'error': f"Could not read file: {str(e)}"}
@@ -308,9 +519,22 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# --- Shared Resources ---
+@st.cache_resource
+def get_analyzer():
+    """One analyzer (and LLM client) shared by every session."""
+    return EnhancedLogAnalyzer()
+
+@st.cache_data(show_spinner=False)
+def analyze_log_content(_analyzer, content: str):
+    """Extract, group and analyze errors, memoized on the log content."""
+    extracted_errors = _analyzer.extract_errors(content)
+    error_groups = _analyzer.group_similar_errors(extracted_errors)
+    return extracted_errors, _analyzer.analyze_error_patterns(error_groups)
+
+analyzer = get_analyzer()
+
 # --- Initialize Session State ---
-if 'analyzer' not in st.session_state:
-    st.session_state.analyzer = EnhancedLogAnalyzer()
 if 'errors' not in st.session_state:
     st.session_state.errors = []
 if 'error_patterns' not in st.session_state:
@@ -319,6 +543,10 @@ if 'comprehensive_analysis' not in st.session_state:
     st.session_state.comprehensive_analysis = ""
 if 'fix_recommendations' not in st.session_state:
     st.session_state.fix_recommendations = ""
+if 'analysis_cache' not in st.session_state:
+    st.session_state.analysis_cache = OrderedDict()  # (group_id, count) set -> (analysis, fixes), LRU
+if 'dash_stats' not in st.session_state:
+    st.session_state.dash_stats = {}
 
 # --- Sidebar ---
 st.sidebar.title("📊 Enhanced LogAnalytics")
@@ -349,24 +577,15 @@ def process_uploaded_file():
             content = uploaded_file.getvalue().decode("utf-8")
             
             with st.spinner("Analyzing log file..."):
-                # Extract individual errors
-                extracted_errors = st.session_state.analyzer.extract_errors(content)
+                # Extract, group and analyze errors (cached on the file content)
+                extracted_errors, error_patterns = analyze_log_content(analyzer, content)
                 st.session_state.errors = extracted_errors
-                
-                # Group similar errors
-                error_groups = st.session_state.analyzer.group_similar_errors(extracted_errors)
-                
-                # Analyze error patterns
-                error_patterns = st.session_state.analyzer.analyze_error_patterns(error_groups)
                 st.session_state.error_patterns = error_patterns
+                update_dash_stats()
                 
-                # Get comprehensive analysis
+                # Get comprehensive analysis and fix recommendations in one streamed request
                 if error_patterns:
-                    with st.spinner("Generating comprehensive analysis..."):
-                        st.session_state.comprehensive_analysis = st.session_state.analyzer.get_comprehensive_analysis(error_patterns)
-                    
-                    with st.spinner("Generating fix recommendations..."):
-                        st.session_state.fix_recommendations = st.session_state.analyzer.get_unified_fix_recommendations(error_patterns)
+                    generate_analysis_and_fixes(error_patterns)
                 
                 return True
         except Exception as e:
@@ -374,8 +593,54 @@ def process_uploaded_file():
             return False
     return False
 
+def update_dash_stats():
+    """Compute the dashboard summary figures once per processed log."""
+    error_patterns = st.session_state.error_patterns
+    # The patterns table belongs to the previous log; the Error Patterns page rebuilds it
+    st.session_state.pop('_patterns_df', None)
+    unique_files = set()
+    for pattern in error_patterns:
+        unique_files.update(pattern['common_files'])
+    st.session_state.dash_stats = {
+        'total_errors': len(st.session_state.errors),
+        'unique_patterns': len(error_patterns),
+        'top_error': error_patterns[0]['error_type'] if error_patterns else None,
+        'unique_files': len(unique_files),
+    }
+
+def generate_analysis_and_fixes(error_patterns):
+    """Stream the combined LLM response onto the page and store both sections in session state."""
+    # Skip the LLM entirely when the error distribution has not changed since the last run
+    cache_key = tuple(sorted((pattern['group_id'], pattern['count']) for pattern in error_patterns))
+    cache = st.session_state.analysis_cache
+    if cache_key in cache:
+        cache.move_to_end(cache_key)
+        (st.session_state.comprehensive_analysis,
+         st.session_state.fix_recommendations) = cache[cache_key]
+        return
+    
+    with st.status("Generating analysis and fix recommendations...", expanded=True) as status:
+        response = st.write_stream(analyzer.stream_combined_analysis_and_fixes(error_patterns))
+        analysis, fixes = analyzer.split_combined_response(response)
+        if fixes is None:
+            # The model ignored the format; keep the streamed text as the analysis
+            status.update(label="Generating fix recommendations...")
+            fixes = st.write_stream(analyzer.stream_unified_fix_recommendations(error_patterns))
+        status.update(label="Analysis and fix recommendations ready", state="complete", expanded=False)
+    st.session_state.comprehensive_analysis = analysis
+    st.session_state.fix_recommendations = fixes
+    cache[cache_key] = (
+        st.session_state.comprehensive_analysis,
+        st.session_state.fix_recommendations
+    )
+    if len(cache) > ANALYSIS_CACHE_MAX:
+        cache.popitem(last=False)
+
 def create_error_distribution_chart(error_patterns):
     """Create a bar chart showing distribution of error types."""
+    import pandas as pd
+    import plotly.express as px
+    
     if not error_patterns:
         return None
     
@@ -409,54 +674,51 @@ def create_error_distribution_chart(error_patterns):
 
 def create_error_file_heatmap(error_patterns):
     """Create a heatmap showing which files have which errors."""
+    import numpy as np
+    import plotly.express as px
+    
     if not error_patterns:
         return None
     
-    # Collect data for heatmap
-    data = []
+    # Build the file x error-type matrix directly; every cell is already unique
+    error_types = sorted({pattern['error_type'] for pattern in error_patterns})
+    files = sorted({file for pattern in error_patterns for file in pattern['common_files_basenames']})
+    
+    if not files:
+        return None
+    
+    type_idx = {error_type: i for i, error_type in enumerate(error_types)}
+    file_idx = {file: i for i, file in enumerate(files)}
+    matrix = np.zeros((len(files), len(error_types)), dtype=np.int32)
     for pattern in error_patterns:
-        error_type = pattern['error_type']
-        for file, count in pattern['common_files'].items():
-            # Get basename of file to make chart more readable
-            file_basename = os.path.basename(file)
-            data.append({
-                'File': file_basename,
-                'Error Type': error_type,
-                'Count': count
-            })
+        col = type_idx[pattern['error_type']]
+        for file_basename, count in pattern['common_files_basenames'].items():
+            matrix[file_idx[file_basename], col] += count
     
-    # Create DataFrame
-    df = pd.DataFrame(data)
+    # Create heatmap
+    fig = px.imshow(
+        matrix,
+        x=error_types,
+        y=files,
+        labels=dict(x="Error Type", y="File Path", color="Error Count"),
+        title="Error Distribution Across Files",
+        color_continuous_scale='Viridis'
+    )
     
-    # If we have data, create pivot table for heatmap
-    if not df.empty:
-        pivot_df = df.pivot_table(
-            index='File', 
-            columns='Error Type', 
-            values='Count',
-            fill_value=0
-        )
-        
-        # Create heatmap
-        fig = px.imshow(
-            pivot_df,
-            labels=dict(x="Error Type", y="File Path", color="Error Count"),
-            title="Error Distribution Across Files",
-            color_continuous_scale='Viridis'
-        )
-        
-        fig.update_layout(
-            xaxis_title='Error Type',
-            yaxis_title='File Path',
-            template='plotly_white'
-        )
-        
-        return fig
+    fig.update_layout(
+        xaxis_title='Error Type',
+        yaxis_title='File Path',
+        template='plotly_white'
+    )
     
-    return None
+    return fig
 
 def create_error_network_chart(error_patterns):
     """Create a network chart showing relationships between files and errors."""
+    import numpy as np
+    import pandas as pd
+    import plotly.express as px
+    
     # This is a placeholder - in a real implementation, we'd use networkx and plotly
     # to create an actual network visualization
     
@@ -467,8 +729,7 @@ def create_error_network_chart(error_patterns):
     data = []
     for pattern in error_patterns:
         error_type = pattern['error_type']
-        for file, count in pattern['common_files'].items():
-            file_basename = os.path.basename(file)
+        for file_basename, count in pattern['common_files_basenames'].items():
             data.append({
                 'File': file_basename,
                 'Error Type': error_type,
@@ -499,8 +760,109 @@ def create_error_network_chart(error_patterns):
     
     return None
 
+_CHART_BUILDERS = {
+    'distribution': create_error_distribution_chart,
+    'heatmap': create_error_file_heatmap,
+    'network': create_error_network_chart,
+}
+
+@st.cache_data(show_spinner=False)
+def _cached_chart(kind: str, chart_key: tuple):
+    """Build a chart from the compact pattern key, memoized across reruns."""
+    patterns = [
+        {'error_type': error_type, 'count': count, 'common_files_basenames': dict(files)}
+        for error_type, count, files in chart_key
+    ]
+    return _CHART_BUILDERS[kind](patterns)
+
+def get_error_chart(kind: str, error_patterns):
+    """Return the cached chart of the given kind for the current error patterns."""
+    # Only the fields the charts read go into the cache key; hashing the full
+    # patterns (with every error dict) would cost more than building the figure
+    chart_key = tuple(
+        (pattern['error_type'], pattern['count'], tuple(pattern['common_files_basenames'].items()))
+        for pattern in error_patterns
+    )
+    return _cached_chart(kind, chart_key)
+
+def render_metric_row(metrics, last_updated=None, columns=4):
+    """Render a row of metric cards with a single markdown call.
+    
+    Each metric is a ``(value, label)`` or ``(value, label, color)`` tuple.
+    """
+    cards = []
+    for value, label, *color in metrics:
+        style = f' style="color: {color[0]};"' if color else ''
+        footer = f'<div class="last-updated">Last updated: {last_updated}</div>' if last_updated else ''
+        cards.append(
+            f'<div class="metric-card" style="flex: 1;">'
+            f'<div class="metric-value"{style}>{value}</div>'
+            f'<div class="metric-label">{label}</div>{footer}</div>'
+        )
+    # Keep the card width of a full row when some metrics are hidden
+    cards.extend('<div style="flex: 1;"></div>' for _ in range(columns - len(cards)))
+    st.markdown(f'<div style="display: flex; gap: 1rem;">{"".join(cards)}</div>', unsafe_allow_html=True)
+
+def render_visualizations(error_patterns):
+    """Render the dashboard charts."""
+    st.subheader("Error Visualizations")
+    
+    # Error Distribution Chart
+    error_chart = get_error_chart('distribution', error_patterns)
+    if error_chart:
+        st.plotly_chart(error_chart, use_container_width=True)
+    
+    # Error File Heatmap
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        heatmap = get_error_chart('heatmap', error_patterns)
+        if heatmap:
+            st.plotly_chart(heatmap, use_container_width=True)
+    
+    with col2:
+        network_chart = get_error_chart('network', error_patterns)
+        if network_chart:
+            st.plotly_chart(network_chart, use_container_width=True)
+
+def render_quick_insights(error_patterns):
+    """Render expanders for the top 3 error patterns."""
+    st.subheader("Quick Insights")
+    
+    for i, pattern in enumerate(error_patterns[:3], 1):
+        with st.expander(f"Error Pattern #{i}: {pattern['error_type']} ({pattern['count']} occurrences)"):
+            st.write(f"**Error Type:** {pattern['error_type']}")
+            st.write(f"**Occurrence Count:** {pattern['count']}")
+            st.write("**Common Files Affected:**")
+            for file, count in pattern['common_files'].items():
+                st.write(f"- {file} ({count} occurrences)")
+            st.write(f"**Representative Error Message:** {pattern['representative_error'].get('error_message', 'No message')}")
+
+def render_dashboard(error_patterns, dash_stats):
+    """Render the error summary cards and charts shared by the Loki and upload dashboards."""
+    st.subheader("Error Summary")
+    
+    metrics = [
+        (dash_stats['total_errors'], "Total Errors"),
+        (dash_stats['unique_patterns'], "Error Patterns"),
+    ]
+    if not error_patterns:
+        # Nothing to chart; skip the pattern cards and the visualization section
+        render_metric_row(metrics)
+        return
+    
+    metrics += [
+        (dash_stats['top_error'], "Most Common Error"),
+        (dash_stats['unique_files'], "Affected Files"),
+    ]
+    render_metric_row(metrics)
+    
+    render_visualizations(error_patterns)
+
 def show_settings():
     """Display and manage Loki configuration settings."""
+    import requests
+    
     st.title("Settings")
     
     with st.form("loki_settings"):
@@ -537,8 +899,18 @@ def show_settings():
             except Exception as e:
                 st.error(f"Failed to connect to Loki: {str(e)}")
 
+def iter_loki_messages(response) -> Iterator[str]:
+    """Yield log messages from a streamed Loki query_range response as they are parsed."""
+    import ijson
+    
+    response.raw.decode_content = True
+    for _, message in ijson.items(response.raw, 'data.result.item.values.item'):
+        yield message
+
 def fetch_and_process_loki_logs():
     """Fetch logs from Loki and process them like uploaded files."""
+    import requests
+    
     if not st.session_state.loki_config.get('is_configured'):
         return False
 
@@ -562,47 +934,31 @@ def fetch_and_process_loki_logs():
         if st.session_state.loki_config.get('username') and st.session_state.loki_config.get('password'):
             auth = (st.session_state.loki_config['username'], st.session_state.loki_config['password'])
         
-        response = requests.get(
+        # Stream the body and parse it incrementally, so the raw JSON and the
+        # decoded document are never held in memory at the same time
+        with requests.get(
             url,
             params=params,
             headers=headers,
             auth=auth,
-            verify=st.session_state.loki_config['verify_ssl']
-        )
-        response.raise_for_status()
-        data = response.json()
-        
-        # Convert Loki logs to the format expected by our analyzer
-        log_content = []
-        if 'data' in data and 'result' in data['data']:
-            for stream in data['data']['result']:
-                for value in stream['values']:
-                    timestamp, message = value
-                    log_content.append(message)
-        
-        # Join log messages with newlines to create a single string
-        content = '\n'.join(log_content)
+            verify=st.session_state.loki_config['verify_ssl'],
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            # Join log messages with newlines to create a single string
+            content = '\n'.join(iter_loki_messages(response))
         
         # Process logs using existing analyzer
         with st.spinner("Analyzing Loki logs..."):
-            # Extract individual errors
-            extracted_errors = st.session_state.analyzer.extract_errors(content)
+            # Extract, group and analyze errors (cached on the log content)
+            extracted_errors, error_patterns = analyze_log_content(analyzer, content)
             st.session_state.errors = extracted_errors
-            
-            # Group similar errors
-            error_groups = st.session_state.analyzer.group_similar_errors(extracted_errors)
-            
-            # Analyze error patterns
-            error_patterns = st.session_state.analyzer.analyze_error_patterns(error_groups)
             st.session_state.error_patterns = error_patterns
+            update_dash_stats()
             
-            # Get comprehensive analysis
+            # Get comprehensive analysis and fix recommendations in one streamed request
             if error_patterns:
-                with st.spinner("Generating comprehensive analysis..."):
-                    st.session_state.comprehensive_analysis = st.session_state.analyzer.get_comprehensive_analysis(error_patterns)
-                
-                with st.spinner("Generating fix recommendations..."):
-                    st.session_state.fix_recommendations = st.session_state.analyzer.get_unified_fix_recommendations(error_patterns)
+                generate_analysis_and_fixes(error_patterns)
             
             return True
             
@@ -610,10 +966,30 @@ def fetch_and_process_loki_logs():
         st.error(f"Error fetching logs from Loki: {str(e)}")
         return False
 
-# --- Main Content ---
-st.title(page)
+# Placeholder snippet shown under "Immediate Fixes"
+EXAMPLE_FIX = """# Example fix for the most common error pattern
+def fix_example():
+    try:
+        # Fixed implementation
+        result = process_data(validated_input)
+        return result
+    except ValueError as e:
+        logger.error(f"Data processing error: {e}")
+        return None
+"""
+
+COPY_FIX_BUTTON = f"""
+<button id="copy-fix" style="padding: 0.25rem 0.75rem; border: 1px solid #dedede; border-radius: 0.5rem; background: white; cursor: pointer;">Copy Fix to Clipboard</button>
+<script>
+const button = document.getElementById("copy-fix");
+button.onclick = () => navigator.clipboard.writeText({json.dumps(EXAMPLE_FIX)})
+    .then(() => {{ button.textContent = "Code copied to clipboard!"; }});
+</script>
+"""
 
-if page == "Dashboard":
+# --- Pages ---
+def page_dashboard():
+    """Dashboard page: Loki or uploaded-file summary, metrics and charts."""
     # Check if Loki is configured
     if st.session_state.loki_config.get('is_configured'):
         # Add search and time range controls
@@ -629,7 +1005,7 @@ if page == "Dashboard":
         with col3:
             if st.button("Refresh"):
                 st.session_state.file_processed = fetch_and_process_loki_logs()
-                st.experimental_rerun()
+                st.rerun()
         
         # Process Loki data if not already processed
         if 'file_processed' not in st.session_state or not st.session_state.file_processed:
@@ -638,82 +1014,31 @@ if page == "Dashboard":
         if st.session_state.file_processed:
             st.success("Successfully analyzed Loki logs")
             
-            # Display summary metrics in cards
-            col1, col2, col3, col4 = st.columns(4)
+            import pandas as pd
             
-            with col1:
-                error_count = len([log for log in st.session_state.errors if 'ERROR' in log.get('full_traceback', '').upper()])
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <div class="metric-value" style="color: #dc3545;">{error_count}</div>
-                        <div class="metric-label">Errors</div>
-                        <div class="last-updated">Last updated: {datetime.now().strftime('%H:%M:%S')}</div>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
+            # Levels are precomputed by extract_errors
+            errors = st.session_state.errors
+            level_counts = Counter(error['level'] for error in errors)
             
-            with col2:
-                warning_count = len([log for log in st.session_state.errors if 'WARNING' in log.get('full_traceback', '').upper()])
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <div class="metric-value" style="color: #ffc107;">{warning_count}</div>
-                        <div class="metric-label">Warnings</div>
-                        <div class="last-updated">Last updated: {datetime.now().strftime('%H:%M:%S')}</div>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
-            
-            with col3:
-                info_count = len([log for log in st.session_state.errors if 'INFO' in log.get('full_traceback', '').upper()])
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <div class="metric-value" style="color: #0d6efd;">{info_count}</div>
-                        <div class="metric-label">Info</div>
-                        <div class="last-updated">Last updated: {datetime.now().strftime('%H:%M:%S')}</div>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
-            
-            with col4:
-                resolved_count = 0  # This would need to be tracked separately
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <div class="metric-value" style="color: #198754;">{resolved_count}</div>
-                        <div class="metric-label">Resolved</div>
-                        <div class="last-updated">Last updated: {datetime.now().strftime('%H:%M:%S')}</div>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
+            # Display summary metrics in cards
+            render_metric_row([
+                (level_counts['error'], "Errors", "#dc3545"),
+                (level_counts['warning'], "Warnings", "#ffc107"),
+                (level_counts['info'], "Info", "#0d6efd"),
+                (0, "Resolved", "#198754"),  # This would need to be tracked separately
+            ], last_updated=datetime.now().strftime('%H:%M:%S'))
 
             # Recent Logs section
             st.subheader("Recent Logs")
             
-            # Convert logs to DataFrame for display
-            log_entries = []
-            for error in st.session_state.errors:
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # You might want to extract this from the log
-                message = error.get('error_message', '')
-                level = 'error' if 'ERROR' in error.get('full_traceback', '').upper() else \
-                       'warning' if 'WARNING' in error.get('full_traceback', '').upper() else 'info'
-                service = 'system'  # You might want to extract this from the log
-                
-                log_entries.append({
-                    'Time': timestamp,
-                    'Message': message,
-                    'Level': level,
-                    'Service': service
+            # Build only the displayed columns, not a frame of every error field
+            if errors:
+                df = pd.DataFrame({
+                    'Time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),  # You might want to extract this from the log
+                    'Message': [error.get('error_message') or '' for error in errors],
+                    'Level': [error['level'] for error in errors],
+                    'Service': 'system'  # You might want to extract this from the log
                 })
-            
-            if log_entries:
-                df = pd.DataFrame(log_entries)
                 
                 # Apply search filter if provided
                 if search_query:
@@ -739,85 +1064,8 @@ if page == "Dashboard":
             else:
                 st.info("No logs found for the selected time range.")
 
-            # Error Summary section
-            st.subheader("Error Summary")
-            
-            total_errors = len(st.session_state.errors)
-            unique_patterns = len(st.session_state.error_patterns)
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <div class="metric-value">{total_errors}</div>
-                        <div class="metric-label">Total Errors</div>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
-            
-            with col2:
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <div class="metric-value">{unique_patterns}</div>
-                        <div class="metric-label">Error Patterns</div>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
-            
-            if st.session_state.error_patterns:
-                with col3:
-                    top_error = st.session_state.error_patterns[0]['error_type']
-                    st.markdown(
-                        f"""
-                        <div class="metric-card">
-                            <div class="metric-value">{top_error}</div>
-                            <div class="metric-label">Most Common Error</div>
-                        </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
-                
-                with col4:
-                    unique_files = set()
-                    for pattern in st.session_state.error_patterns:
-                        for file in pattern['common_files'].keys():
-                            unique_files.add(file)
-                    
-                    st.markdown(
-                        f"""
-                        <div class="metric-card">
-                            <div class="metric-value">{len(unique_files)}</div>
-                            <div class="metric-label">Affected Files</div>
-                        </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
-            
-            # Display visualizations
-            st.subheader("Error Visualizations")
-            
-            # Error Distribution Chart
-            error_chart = create_error_distribution_chart(st.session_state.error_patterns)
-            if error_chart:
-                st.plotly_chart(error_chart, use_container_width=True)
-            
-            # Error File Heatmap
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                heatmap = create_error_file_heatmap(st.session_state.error_patterns)
-                if heatmap:
-                    st.plotly_chart(heatmap, use_container_width=True)
-            
-            with col2:
-                network_chart = create_error_network_chart(st.session_state.error_patterns)
-                if network_chart:
-                    st.plotly_chart(network_chart, use_container_width=True)
+            # Error summary metrics and visualizations
+            render_dashboard(st.session_state.error_patterns, st.session_state.dash_stats)
     
     elif uploaded_file:
         # Existing file upload logic
@@ -827,160 +1075,85 @@ if page == "Dashboard":
         if st.session_state.file_processed:
             st.success(f"Analyzed log file: {uploaded_file.name}")
             
-            # Display summary metrics
-            st.subheader("Error Summary")
-            
-            total_errors = len(st.session_state.errors)
-            unique_patterns = len(st.session_state.error_patterns)
-            
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <div class="metric-value">{total_errors}</div>
-                        <div class="metric-label">Total Errors</div>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
-            
-            with col2:
-                st.markdown(
-                    f"""
-                    <div class="metric-card">
-                        <div class="metric-value">{unique_patterns}</div>
-                        <div class="metric-label">Error Patterns</div>
-                    </div>
-                    """, 
-                    unsafe_allow_html=True
-                )
-            
-            if st.session_state.error_patterns:
-                with col3:
-                    top_error = st.session_state.error_patterns[0]['error_type']
-                    top_count = st.session_state.error_patterns[0]['count']
-                    st.markdown(
-                        f"""
-                        <div class="metric-card">
-                            <div class="metric-value">{top_error}</div>
-                            <div class="metric-label">Most Common Error</div>
-                        </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
-                
-                with col4:
-                    unique_files = set()
-                    for pattern in st.session_state.error_patterns:
-                        for file in pattern['common_files'].keys():
-                            unique_files.add(file)
-                    
-                    st.markdown(
-                        f"""
-                        <div class="metric-card">
-                            <div class="metric-value">{len(unique_files)}</div>
-                            <div class="metric-label">Affected Files</div>
-                        </div>
-                        """, 
-                        unsafe_allow_html=True
-                    )
-            
-            # Display visualizations
-            st.subheader("Error Visualizations")
-            
-            # Error Distribution Chart
-            error_chart = create_error_distribution_chart(st.session_state.error_patterns)
-            if error_chart:
-                st.plotly_chart(error_chart, use_container_width=True)
-            
-            # Error File Heatmap
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                heatmap = create_error_file_heatmap(st.session_state.error_patterns)
-                if heatmap:
-                    st.plotly_chart(heatmap, use_container_width=True)
-            
-            with col2:
-                network_chart = create_error_network_chart(st.session_state.error_patterns)
-                if network_chart:
-                    st.plotly_chart(network_chart, use_container_width=True)
+            # Error summary metrics and visualizations
+            render_dashboard(st.session_state.error_patterns, st.session_state.dash_stats)
             
             # Quick insights
             if st.session_state.error_patterns:
-                st.subheader("Quick Insights")
-                
-                # Display the top 3 error patterns
-                for i, pattern in enumerate(st.session_state.error_patterns[:3], 1):
-                    with st.expander(f"Error Pattern #{i}: {pattern['error_type']} ({pattern['count']} occurrences)"):
-                        st.write(f"**Error Type:** {pattern['error_type']}")
-                        st.write(f"**Occurrence Count:** {pattern['count']}")
-                        st.write("**Common Files Affected:**")
-                        for file, count in pattern['common_files'].items():
-                            st.write(f"- {file} ({count} occurrences)")
-                        st.write(f"**Representative Error Message:** {pattern['representative_error'].get('error_message', 'No message')}")
+                render_quick_insights(st.session_state.error_patterns)
                 
                 # Add a button to navigate to comprehensive analysis
                 if st.button("View Comprehensive Analysis"):
                     st.session_state.current_page = "Comprehensive Analysis"
-                    st.experimental_rerun()
+                    st.rerun()
                 
             # Add a refresh button
             if st.button("Refresh Analysis"):
                 st.session_state.file_processed = False
-                st.experimental_rerun()
+                # Drop derived state so the next run rebuilds it exactly once
+                for key in ('dash_stats', '_patterns_df'):
+                    st.session_state.pop(key, None)
+                st.rerun()
     else:
         st.info("Please upload a log file using the sidebar to begin analysis.")
         
         # Display sample dashboard with dummy data
         st.subheader("Sample Dashboard Preview")
-        st.image("https://via.placeholder.com/800x400?text=Sample+Error+Dashboard", use_column_width=True)
+        st.markdown(SAMPLE_DASHBOARD_IMG, unsafe_allow_html=True)
 
-elif page == "Error Patterns":
+def page_error_patterns():
+    """Error Patterns page: overview table and per-pattern detail."""
     if not st.session_state.error_patterns:
         st.info("No error patterns to display. Please upload a log file first.")
     else:
+        import pandas as pd
+        
         st.subheader("Identified Error Patterns")
         
         # Create tabs for different views
         tab1, tab2 = st.tabs(["Pattern Overview", "Detailed View"])
         
         with tab1:
-            # Create a dataframe for the patterns
-            pattern_data = []
-            for i, pattern in enumerate(st.session_state.error_patterns):
-                pattern_data.append({
-                    "ID": i+1,
-                    "Error Type": pattern['error_type'],
-                    "Count": pattern['count'],
-                    "Top File": list(pattern['common_files'].keys())[0] if pattern['common_files'] else "N/A",
-                    "Error Message": pattern['representative_error'].get('error_message', 'No message')[:50] + "..."
+            # Build the patterns dataframe column-wise, once per set of patterns
+            # (update_dash_stats drops it whenever new patterns are stored)
+            if '_patterns_df' not in st.session_state:
+                ids, types, counts, top_files, messages = [], [], [], [], []
+                for i, pattern in enumerate(st.session_state.error_patterns):
+                    message = pattern['representative_error'].get('error_message', 'No message')
+                    ids.append(i + 1)
+                    types.append(pattern['error_type'])
+                    counts.append(pattern['count'])
+                    top_files.append(pattern['top_file'])
+                    messages.append(message[:50] + "..." if len(message) > 50 else message)
+                
+                st.session_state._patterns_df = pd.DataFrame({
+                    "ID": ids,
+                    "Error Type": types,
+                    "Count": counts,
+                    "Top File": top_files,
+                    "Error Message": messages
                 })
             
-            pattern_df = pd.DataFrame(pattern_data)
-            st.dataframe(pattern_df, use_container_width=True)
+            st.dataframe(st.session_state._patterns_df, use_container_width=True)
             
             # Display error distribution chart
-            error_chart = create_error_distribution_chart(st.session_state.error_patterns)
+            error_chart = get_error_chart('distribution', st.session_state.error_patterns)
             if error_chart:
                 st.plotly_chart(error_chart, use_container_width=True)
         
         with tab2:
-            # Select a pattern to view in detail
-            pattern_options = {
-                f"Pattern {i+1}: {pattern['error_type']} ({pattern['count']} occurrences)": i 
-                for i, pattern in enumerate(st.session_state.error_patterns)
-            }
+            # Select a pattern to view in detail; labels are formatted on demand
+            def format_pattern(i):
+                pattern = st.session_state.error_patterns[i]
+                return f"Pattern {i+1}: {pattern['error_type']} ({pattern['count']} occurrences)"
             
-            selected = st.selectbox(
+            pattern_index = st.selectbox(
                 "Select a pattern to view in detail:",
-                options=list(pattern_options.keys())
+                options=range(len(st.session_state.error_patterns)),
+                format_func=format_pattern
             )
             
-            if selected:
-                pattern_index = pattern_options[selected]
+            if pattern_index is not None:
                 pattern = st.session_state.error_patterns[pattern_index]
                 
                 # Display pattern details
@@ -989,15 +1162,11 @@ elif page == "Error Patterns":
                 
                 # Show affected files
                 st.write("**Affected Files:**")
-                file_data = []
-                for file, count in pattern['common_files'].items():
-                    file_data.append({
-                        "File Path": file,
-                        "Error Count": count
-                    })
-                
-                if file_data:
-                    file_df = pd.DataFrame(file_data)
+                if pattern['common_files']:
+                    file_df = pd.DataFrame(
+                        list(pattern['common_files'].items()),
+                        columns=["File Path", "Error Count"]
+                    )
                     st.dataframe(file_df, use_container_width=True)
                 
                 # Show representative error
@@ -1006,13 +1175,17 @@ elif page == "Error Patterns":
                 
                 # Show all errors in this pattern
                 with st.expander("View All Errors in this Pattern"):
-                    for i, error in enumerate(pattern['errors'], 1):
-                        st.write(f"**Error {i}:**")
-                        st.write(f"- File: {error.get('file_path', 'Unknown')}")
-                        st.write(f"- Line: {error.get('line_number', 'Unknown')}")
-                        st.write(f"- Message: {error.get('error_message', 'No message')}")
+                    # One markdown element for the whole list instead of four writes per error
+                    st.markdown("\n\n".join(
+                        f"**Error {i}:**\n"
+                        f"- File: {error.get('file_path', 'Unknown')}\n"
+                        f"- Line: {error.get('line_number', 'Unknown')}\n"
+                        f"- Message: {error.get('error_message', 'No message')}"
+                        for i, error in enumerate(pattern['errors'], 1)
+                    ))
 
-elif page == "Comprehensive Analysis":
+def page_comprehensive_analysis():
+    """Comprehensive Analysis page: LLM analysis and file heatmap."""
     if not st.session_state.comprehensive_analysis:
         st.info("No analysis available. Please upload a log file first.")
     else:
@@ -1025,16 +1198,17 @@ elif page == "Comprehensive Analysis":
         st.subheader("Error Pattern Relationships")
         
         # Display the heatmap
-        heatmap = create_error_file_heatmap(st.session_state.error_patterns)
+        heatmap = get_error_chart('heatmap', st.session_state.error_patterns)
         if heatmap:
             st.plotly_chart(heatmap, use_container_width=True)
         
         # Call to action
         if st.button("View Fix Recommendations"):
             st.session_state.current_page = "Fix Recommendations"
-            st.experimental_rerun()
+            st.rerun()
 
-elif page == "Fix Recommendations":
+def page_fix_recommendations():
+    """Fix Recommendations page: LLM fixes and implementation plan."""
     if not st.session_state.fix_recommendations:
         st.info("No fix recommendations available. Please upload a log file first.")
     else:
@@ -1050,47 +1224,48 @@ elif page == "Fix Recommendations":
         tab1, tab2, tab3 = st.tabs(["Immediate Fixes", "Medium-term Fixes", "Long-term Prevention"])
         
         with tab1:
-            st.write("### Immediate Fixes")
-            st.write("Apply these fixes to resolve the most critical errors:")
-            
             # This would ideally be populated from the fix recommendations
             # For now, we'll use placeholder content
-            st.code("""
-# Example fix for the most common error pattern
-def fix_example():
-    try:
-        # Fixed implementation
-        result = process_data(validated_input)
-        return result
-    except ValueError as e:
-        logger.error(f"Data processing error: {e}")
-        return None
-            """, language="python")
+            st.markdown(
+                "### Immediate Fixes\n\n"
+                "Apply these fixes to resolve the most critical errors:\n\n"
+                f"```python\n{EXAMPLE_FIX}```"
+            )
             
-            # Add "Copy to clipboard" button
-            if st.button("Copy Fix to Clipboard"):
-                st.success("Code copied to clipboard!")
+            # Copy in the browser; no script rerun for a clipboard write
+            components.html(COPY_FIX_BUTTON, height=45)
         
         with tab2:
-            st.write("### Medium-term Fixes")
-            st.write("These fixes should be implemented in the next sprint:")
-            
-            # Medium-term fix suggestions
-            st.write("1. Implement proper input validation across all endpoints")
-            st.write("2. Add comprehensive error handling in core modules")
-            st.write("3. Fix resource management issues")
+            st.markdown("""
+### Medium-term Fixes
+These fixes should be implemented in the next sprint:
+
+1. Implement proper input validation across all endpoints
+2. Add comprehensive error handling in core modules
+3. Fix resource management issues
+""")
         
         with tab3:
-            st.write("### Long-term Prevention")
-            st.write("Implement these practices to prevent similar issues:")
-            
-            # Long-term prevention suggestions
-            st.write("1. Set up automated testing for error cases")
-            st.write("2. Implement code reviews with focus on error handling")
-            st.write("3. Add monitoring and alerting for runtime errors")
+            st.markdown("""
+### Long-term Prevention
+Implement these practices to prevent similar issues:
+
+1. Set up automated testing for error cases
+2. Implement code reviews with focus on error handling
+3. Add monitoring and alerting for runtime errors
+""")
 
-elif page == "Settings":
-    show_settings()
+PAGES = {
+    "Dashboard": page_dashboard,
+    "Error Patterns": page_error_patterns,
+    "Comprehensive Analysis": page_comprehensive_analysis,
+    "Fix Recommendations": page_fix_recommendations,
+    "Settings": show_settings,
+}
+
+# --- Main Content ---
+st.title(page)
+PAGES[page]()
 
 # --- Footer ---
 st.markdown("---")
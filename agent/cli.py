@@ -1,16 +1,18 @@
 import os
 import re
-import glob
-from pathlib import Path
+import mmap
 from typing import List, Dict, Optional, Set, Tuple
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import click
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 from dotenv import load_dotenv
+from langchain.cache import SQLiteCache
 from langchain.chat_models import ChatOpenAI
+from langchain.globals import set_llm_cache
 from langchain.prompts import ChatPromptTemplate
 from langchain.schema import StrOutputParser
 from langchain.schema.runnable import RunnablePassthrough
@@ -20,13 +22,303 @@ load_dotenv()
 
 console = Console()
 
+# Heuristics for recognising a log file, combined into one alternation so a
+# sample is scanned once; bytes patterns, since the sample is read undecoded
+_LOG_PATTERN_RE = re.compile(b'|'.join(b'(?:' + pattern + b')' for pattern in (
+    rb'Traceback \(most recent call last\):',
+    rb'\d{4}-\d{2}-\d{2}',
+    rb'\d{2}:\d{2}:\d{2}',
+    rb'(ERROR|WARNING|INFO|DEBUG|CRITICAL)',
+    rb'Exception|Error:',
+    rb'^\[\w+\]'
+)))
+
+# Directories that never hold logs worth analyzing; find_log_files doesn't descend into them
+_SKIP_DIRS = frozenset({
+    '.git', '.hg', '.svn', 'node_modules', '__pycache__', '.venv', 'venv', 'env',
+    '.tox', 'dist', 'build', '.mypy_cache', '.pytest_cache'
+})
+
+def _iter_candidates(directory: str, extensions, max_depth: int, include_hidden: bool = False):
+    """Yield scandir entries for files with one of the extensions, up to max_depth directory levels deep."""
+    extensions = frozenset(ext.lower() for ext in extensions)
+    splitext = os.path.splitext
+    
+    # Iterative walk; scandir entries carry their type, so no extra stat per item
+    stack = [(directory, 1)]
+    push = stack.append
+    while stack:
+        current_dir, current_depth = stack.pop()
+        try:
+            with os.scandir(current_dir) as entries:
+                for entry in entries:
+                    # Check if it's a file with log extension
+                    if entry.is_file():
+                        _, ext = splitext(entry.name)
+                        if ext.lower() in extensions:
+                            yield entry
+                    
+                    # Queue directories (symlinked ones are not followed, so no cycles)
+                    elif current_depth < max_depth and entry.is_dir(follow_symlinks=False):
+                        if entry.name in _SKIP_DIRS or (not include_hidden and entry.name.startswith('.')):
+                            continue
+                        push((entry.path, current_depth + 1))
+        except OSError as e:
+            console.print(f"[yellow]Error accessing {current_dir}: {e}[/yellow]")
+
+# Marker that starts each traceback block, and the patterns for reading one
+_TRACEBACK_HEADER = 'Traceback (most recent call last):'
+# File path, line number and error type/message in one alternation, so each
+# block is scanned once. The path and message are captured in lookaheads so the
+# scan continues through them, as separate searches would
+_TB_FIELDS_RE = re.compile(
+    r'File "(?=(?P<file>[^"]+)")'
+    r'|line (?P<line>\d+)'
+    r'|(?P<etype>[A-Za-z]+Error|Exception):(?=\s*(?P<emsg>.*))'
+)
+
+def _iter_traceback_blocks(lines):
+    """Yield the stripped, non-empty text between traceback headers, one line at a time."""
+    current = []
+    for line in lines:
+        idx = line.find(_TRACEBACK_HEADER)
+        # A header starts a new block even when it isn't at the start of the line
+        while idx >= 0:
+            current.append(line[:idx])
+            block = ''.join(current).strip()
+            if block:
+                yield block
+            current = []
+            line = line[idx:]
+            idx = line.find(_TRACEBACK_HEADER, 1)
+        current.append(line)
+    block = ''.join(current).strip()
+    if block:
+        yield block
+
+def _parse_traceback_block(block: str) -> Dict:
+    """Read the first file path, line number and error type/message from a block."""
+    context = {}
+    for match in _TB_FIELDS_RE.finditer(block):
+        kind = match.lastgroup
+        if kind == 'file':
+            context.setdefault('file_path', match.group('file'))
+        elif kind == 'line':
+            context.setdefault('line_number', match.group('line'))
+        elif 'error_type' not in context:
+            # An empty message falls back to the error type, as before
+            context['error_type'] = match.group('etype')
+            context['error_message'] = match.group('emsg').strip() or match.group('etype')
+        if len(context) == 4:
+            break
+    context['full_traceback'] = block
+    return context
+
+# Upper bound on simultaneous LLM requests when a review batches its calls
+LLM_MAX_CONCURRENCY = 8
+LLM_MAX_RETRIES = 3
+# Completions are cached on disk by prompt, so repeat reviews skip the API call
+LLM_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'loganalyzer', 'langchain.db')
+
+# File context sent to get_fix: the head of the file (imports) plus a window
+# around the error, within a token budget approximated as 4 chars per token
+PROMPT_HEADER_LINES = 50
+PROMPT_WINDOW_LINES = 100
+PROMPT_MAX_TOKENS = 6000
+
+# Longest list of found log files shown as a Rich table; longer lists print as plain lines
+TABLE_MAX_ROWS = 200
+
+# Number of source files LogAnalyzer keeps in memory, least recently used evicted first
+FILE_CACHE_MAX = 128
+
+def _build_prompt_content(lines: List[str], line_number: int) -> str:
+    """Cut a file down to its header and the lines around line_number for an LLM prompt."""
+    max_chars = PROMPT_MAX_TOKENS * 4
+    content = '\n'.join(lines)
+    if len(content) <= max_chars:
+        return content
+    
+    start = max(0, line_number - PROMPT_WINDOW_LINES)
+    window = '\n'.join(lines[start:line_number + PROMPT_WINDOW_LINES])
+    if start > PROMPT_HEADER_LINES:
+        with_header = '\n'.join(lines[:PROMPT_HEADER_LINES]) + '\n...\n' + window
+        if len(with_header) <= max_chars:
+            return with_header
+    else:
+        # The header overlaps the window, so the window starts at the top of the file
+        start = 0
+        window = '\n'.join(lines[:line_number + PROMPT_WINDOW_LINES])
+    
+    # Over budget even without the header: keep the text centred on the error
+    if len(window) > max_chars:
+        before_error = lines[start:max(start, line_number - 1)]
+        error_offset = len('\n'.join(before_error)) + (1 if before_error else 0)
+        cut = max(0, min(error_offset - max_chars // 2, len(window) - max_chars))
+        window = window[cut:cut + max_chars]
+    return window
+
+# Prompts are parsed once at import and shared by every chain
+_FIX_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert software engineer. 
+    Based on the error and full file context, provide the BEST fix for the code.
+    Return ONLY the code that needs to be changed. Don't add anything else like backticks or words.
+    No explanations, no markdown formatting, just the raw code with proper indentation.
+    Include only the lines that need to be modified.
+    Make sure the code is properly formatted and indented.
+    **NOTE** Please maintain proper indentation.
+
+    Choose the most robust and maintainable solution."""),
+    ("user", """
+    Error Context:
+    {error_context}
+
+    Error Location (specific code around the error):
+    {error_location}
+
+    File Content (the start of the file and the code around the error when it is large):
+    {full_file_content}
+
+    Provide the best fix for the code around line {line_number}:
+    """)
+])
+
+_COMPREHENSIVE_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert software engineer specializing in debugging complex applications.
+    Analyze the provided error patterns, log file, and source code to provide:
+    1. A comprehensive analysis of the main root causes
+    2. A list of recommended fixes grouped by error type or common cause
+    3. Any architectural or systemic improvements that would prevent similar errors
+
+    Be thorough but concise. Focus on identifying underlying patterns rather than individual bugs.
+    Consider the full context of the code when suggesting fixes."""),
+    ("user", """
+    Full Log File Analysis:
+    ----------------------
+    Total Errors: {total_errors}
+
+    Errors By Type:
+    {error_type_summary}
+
+    Errors By File:
+    {file_summary}
+
+    Sample Source Code:
+    {file_content_samples}
+
+    Raw Log Data (Sample):
+    {raw_log}
+
+    Provide your comprehensive analysis and solution recommendations:
+    """)
+])
+
+_FILE_FIX_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert software engineer.
+    Based on the multiple errors in this file, provide a comprehensive fix that addresses all issues.
+    Focus on the most efficient solution that solves the underlying problems.
+    Return the updated full file content with all necessary changes.
+    And please give only python code no need to give any extra symbols or words like python.
+    **EXAMPLE**
+     -WRONG FORMAT:
+     ```python
+        code
+     ```
+
+    Add comments where you've made changes to explain what issues each change addresses."""),
+    ("user", """
+    File Path: {file_path}
+
+    Errors in this file:
+    {errors}
+
+    Original File Content:
+    {file_content}
+
+    Provide the completely updated file content with all fixes applied:
+    """)
+])
+
+_ANALYSIS_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are an expert software engineer analyzing error logs. For the given error type, provide:
+    1. What this error typically means
+    2. Common causes for this error
+    3. General recommendations to fix it
+
+    Be concise but helpful. Don't reference specific files since we only have log data.
+    Format your response with clear bullet points."""),
+    ("user", """
+    Error Type: {error_type}
+    Sample Error Message: {sample_message}
+    Sample Traceback: {sample_traceback}
+
+    Please analyze this error:
+    """)
+])
+
+_DETAILED_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """You are debugging an application. Analyze this specific error and provide:
+    1. What likely caused this specific error
+    2. Possible solutions based on the traceback
+    3. Recommended troubleshooting steps
+
+    Be specific but don't reference code you can't see.
+    Format with clear sections."""),
+    ("user", """
+    Error Type: {error_type}
+    File: {file_path}
+    Line: {line_number}
+    Message: {error_message}
+    Traceback:
+    {traceback}
+
+    Detailed analysis:
+    """)
+])
+
+_REC_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", """Based on the collection of errors found, provide:
+    1. Common patterns you notice
+    2. Recommended next steps for debugging
+    3. Potential system-wide improvements
+
+    Focus on actionable advice that doesn't require source code access."""),
+    ("user", """
+    Errors Found:
+    {error_summary}
+
+    Sample Errors:
+    {sample_errors}
+
+    Recommendations:
+    """)
+])
+
 class LogAnalyzer:
     def __init__(self):
-        self.llm = ChatOpenAI(model="gpt-4o", temperature=0)
+        os.makedirs(os.path.dirname(LLM_CACHE_PATH), exist_ok=True)
+        set_llm_cache(SQLiteCache(database_path=LLM_CACHE_PATH))
+        
+        # Each client keeps its own keep-alive connection pool across calls
+        self.llm = ChatOpenAI(model="gpt-4o", temperature=0, max_retries=LLM_MAX_RETRIES)
+        self.llm_mini = ChatOpenAI(model="gpt-4o-mini", temperature=0, max_retries=LLM_MAX_RETRIES)
         self.console = Console()
-        self.file_cache = {}  # Cache for file contents
+        
+        # Chains are built once and take their inputs at invoke time
+        parser = StrOutputParser()
+        self._fix_chain = _FIX_PROMPT | self.llm | parser
+        self._comprehensive_chain = _COMPREHENSIVE_PROMPT | self.llm | parser
+        self._file_fix_chain = _FILE_FIX_PROMPT | self.llm | parser
+        self._analysis_chain = _ANALYSIS_PROMPT | self.llm_mini | parser
+        self._detailed_chain = _DETAILED_PROMPT | self.llm | parser
+        self._rec_chain = _REC_PROMPT | self.llm | parser
+        self.file_cache: 'OrderedDict[str, str]' = OrderedDict()  # LRU of file contents
+        self._file_index: Optional[Dict[str, List[str]]] = None  # File name -> paths under cwd
+        self._find_file_cache: Dict[str, Optional[str]] = {}  # Resolved find_file results
+        self.file_sizes: Dict[str, int] = {}  # Sizes of files found by find_log_files
 
-    def find_log_files(self, directory: str = '.', extensions: List[str] = ['.log', '.txt'], max_depth: int = 4) -> List[str]:
+    def find_log_files(self, directory: str = '.', extensions: List[str] = ['.log', '.txt'], max_depth: int = 4,
+                       include_hidden: bool = False) -> List[str]:
         """
         Recursively search for log files with specified extensions
         
@@ -34,136 +326,123 @@ class LogAnalyzer:
             directory: Starting directory for search
             extensions: File extensions to consider as log files
             max_depth: Maximum recursion depth
+            include_hidden: Also descend into hidden (dot-prefixed) directories
             
         Returns:
             List of log file paths found
         """
         log_files = []
-        
-        def _search_dir(current_dir, current_depth):
-            if current_depth > max_depth:
-                return
-                
-            try:
-                for item in os.listdir(current_dir):
-                    item_path = os.path.join(current_dir, item)
-                    
-                    # Check if it's a file with log extension
-                    if os.path.isfile(item_path):
-                        _, ext = os.path.splitext(item_path)
-                        if ext.lower() in extensions:
-                            if self._is_likely_log_file(item_path):
-                                log_files.append(item_path)
-                    
-                    # Recurse into directories
-                    elif os.path.isdir(item_path):
-                        _search_dir(item_path, current_depth + 1)
-            except Exception as e:
-                console.print(f"[yellow]Error accessing {current_dir}: {e}[/yellow]")
-        
-        _search_dir(directory, 1)
+        for entry in _iter_candidates(directory, extensions, max_depth, include_hidden):
+            if self._is_likely_log_file(entry.path):
+                log_files.append(entry.path)
+                # The entry keeps its stat result, so the listing needn't stat again
+                try:
+                    self.file_sizes[entry.path] = entry.stat().st_size
+                except OSError:
+                    pass
         return log_files
 
-    def _is_likely_log_file(self, file_path: str, sample_lines: int = 10) -> bool:
+    def _is_likely_log_file(self, file_path: str, sample_size: int = 4096) -> bool:
         """
         Check if a file is likely a log file by examining its content
         
         Args:
             file_path: Path to the file
-            sample_lines: Number of lines to check
+            sample_size: Number of bytes to check from the start of the file
             
         Returns:
             Boolean indicating if the file is likely a log file
         """
         try:
-            if os.path.getsize(file_path) > 10 * 1024 * 1024:  # 10MB limit
-                with open(file_path, 'r') as f:
-                    sample = ''.join([f.readline() for _ in range(sample_lines)])
-            else:
-                with open(file_path, 'r') as f:
-                    sample = f.read(4096)  # Read first 4KB
-                    
-            log_patterns = [
-                r'Traceback \(most recent call last\):',
-                r'\d{4}-\d{2}-\d{2}',
-                r'\d{2}:\d{2}:\d{2}',
-                r'(ERROR|WARNING|INFO|DEBUG|CRITICAL)',
-                r'Exception|Error:',
-                r'^\[\w+\]'
-            ]
-            
-            for pattern in log_patterns:
-                if re.search(pattern, sample):
-                    return True
-                    
-            return False
+            # One raw block read, no size stat and no decoding
+            with open(file_path, 'rb') as f:
+                sample = f.read(sample_size)
+            
+            # NUL bytes mean binary content such as .pyc files. Text in other
+            # encodings passes; logs are read with errors='replace' for that
+            if b'\0' in sample:
+                return False
+            return _LOG_PATTERN_RE.search(sample) is not None
         except Exception:
             return False
 
     def extract_errors(self, log_file: str) -> List[Dict]:
         """Extract all errors from log file."""
-        with open(log_file, 'r') as f:
-            log_content = f.read()
-        
-        error_blocks = re.split(r'(?=Traceback \(most recent call last\):)', log_content)
-        error_blocks = [block.strip() for block in error_blocks if block.strip()]
-        
         errors = []
-        for block in error_blocks:
-            context = {}
-            error_patterns = {
-                'file_path': r'File "([^"]+)"',
-                'line_number': r'line (\d+)',
-                'error_type': r'([A-Za-z]+Error|Exception):',
-                'error_message': r'([A-Za-z]+Error|Exception):\s*(.*)',
-                'full_traceback': block
-            }
-            
-            for key, pattern in error_patterns.items():
-                if key == 'full_traceback':
-                    context[key] = block
-                else:
-                    match = re.search(pattern, block)
-                    if match:
-                        if key == 'error_message' and match.group(2):
-                            context[key] = match.group(2).strip()
-                        else:
-                            context[key] = match.group(1)
-            
-            if context.get('file_path') and context.get('line_number'):
-                errors.append(context)
+        # Stream the log; only the block being assembled is held in memory
+        with open(log_file, 'r', errors='replace') as f:
+            for block in _iter_traceback_blocks(f):
+                context = _parse_traceback_block(block)
+                if context.get('file_path') and context.get('line_number'):
+                    errors.append(context)
         
         return errors
 
     def find_file(self, file_path: str) -> Optional[str]:
         """Find file in the project structure."""
+        if file_path in self._find_file_cache:
+            return self._find_file_cache[file_path]
+        
         if os.path.exists(file_path):
-            return file_path
-            
-        project_root = os.getcwd()
-        for root, _, files in os.walk(project_root):
-            for file in files:
-                if file == os.path.basename(file_path):
-                    return os.path.join(root, file)
-        return None
+            resolved = file_path
+        else:
+            # Walk the project once and answer later lookups from the index
+            if self._file_index is None:
+                self._file_index = self._build_file_index(os.getcwd())
+            resolved = self._file_index.get(os.path.basename(file_path), [None])[0]
+        
+        self._find_file_cache[file_path] = resolved
+        return resolved
+
+    def _build_file_index(self, project_root: str) -> Dict[str, List[str]]:
+        """Map every file name under project_root to its paths, shallowest first."""
+        index: Dict[str, List[str]] = {}
+        # Breadth-first, so a name's first path is its shallowest occurrence
+        queue = deque([project_root])
+        while queue:
+            try:
+                with os.scandir(queue.popleft()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        queue.append(entry.path)
+                elif entry.is_file():
+                    index.setdefault(entry.name, []).append(entry.path)
+        return index
 
     def get_file_content(self, file_path: str) -> Optional[str]:
         """Get the entire content of a file with caching."""
-        if file_path in self.file_cache:
-            return self.file_cache[file_path]
+        content = self.file_cache.get(file_path)
+        if content is not None:
+            self.file_cache.move_to_end(file_path)
+            return content
             
         actual_path = self.find_file(file_path)
         if not actual_path:
             return None
             
         try:
-            with open(actual_path, 'r') as f:
-                content = f.read()
-                self.file_cache[file_path] = content
-                return content
+            with open(actual_path, 'rb') as f:
+                data = f.read()
         except Exception as e:
             console.print(f"[red]Error reading file {file_path}: {str(e)}[/red]")
             return None
+        # Decode once; surrogateescape keeps undecodable bytes intact for write-back
+        content = data.decode('utf-8', errors='surrogateescape')
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        self._cache_file(file_path, content)
+        return content
+
+    def _cache_file(self, file_path: str, content: str):
+        """Insert file content into the LRU cache, evicting the least recently used file."""
+        self.file_cache[file_path] = content
+        self.file_cache.move_to_end(file_path)
+        if len(self.file_cache) > FILE_CACHE_MAX:
+            self.file_cache.popitem(last=False)
 
     def get_relevant_code(self, file_path: str, line_number: int, context_lines: int = 5) -> Dict:
         """Get relevant code around the error line and full file content."""
@@ -182,7 +461,8 @@ class LogAnalyzer:
                 'code': relevant_code,
                 'start_line': start,
                 'end_line': end,
-                'full_content': full_content
+                'full_content': full_content,
+                'prompt_content': _build_prompt_content(lines, line_number)
             }
         except Exception as e:
             return {'error': f"Could not process file: {str(e)}"}
@@ -197,10 +477,11 @@ class LogAnalyzer:
             if not actual_path:
                 return False
                 
-            with open(actual_path, 'w') as f:
-                f.write('\n'.join(new_lines))
+            new_content = '\n'.join(new_lines)
+            with open(actual_path, 'w', encoding='utf-8', errors='surrogateescape') as f:
+                f.write(new_content)
                 
-            self.file_cache[file_path] = '\n'.join(new_lines)
+            self._cache_file(file_path, new_content)
             return True
         except Exception as e:
             console.print(f"[red]Error applying fix: {str(e)}[/red]")
@@ -208,43 +489,12 @@ class LogAnalyzer:
 
     def get_fix(self, error_context: Dict, code_context: Dict) -> str:
         """Get the best fix for the error with access to the entire file."""
-        fix_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an expert software engineer. 
-            Based on the error and full file context, provide the BEST fix for the code.
-            Return ONLY the code that needs to be changed. Don't add anything else like backticks or words.
-            No explanations, no markdown formatting, just the raw code with proper indentation.
-            Include only the lines that need to be modified.
-            Make sure the code is properly formatted and indented.
-            **NOTE** Please maintain proper indentation.
-            
-            Choose the most robust and maintainable solution."""),
-            ("user", """
-            Error Context:
-            {error_context}
-            
-            Error Location (specific code around the error):
-            {error_location}
-            
-            Full File Content:
-            {full_file_content}
-            
-            Provide the best fix for the code around line {line_number}:
-            """)
-        ])
-
-        fix_chain = (
-            {
-                "error_context": lambda x: str(error_context),
-                "error_location": lambda x: code_context['code'],
-                "full_file_content": lambda x: code_context['full_content'],
-                "line_number": lambda x: error_context['line_number']
-            }
-            | fix_prompt
-            | self.llm
-            | StrOutputParser()
-        )
-
-        return fix_chain.invoke({})
+        return self._fix_chain.invoke({
+            "error_context": str(error_context),
+            "error_location": code_context['code'],
+            "full_file_content": code_context['prompt_content'],
+            "line_number": error_context['line_number']
+        })
 
     def analyze_log_patterns(self, errors: List[Dict], log_content: str) -> Dict:
         """Analyze patterns in the errors to identify common issues."""
@@ -291,112 +541,54 @@ class LogAnalyzer:
                 file_content = pattern_analysis['file_contents'][file_path]
                 file_content_samples.append(f"File: {file_path}\n{file_content[:1500]}...")
         
-        comprehensive_prompt = ChatPromptTemplate.from_messages([
-            ("system", """You are an expert software engineer specializing in debugging complex applications.
-            Analyze the provided error patterns, log file, and source code to provide:
-            1. A comprehensive analysis of the main root causes
-            2. A list of recommended fixes grouped by error type or common cause
-            3. Any architectural or systemic improvements that would prevent similar errors
-            
-            Be thorough but concise. Focus on identifying underlying patterns rather than individual bugs.
-            Consider the full context of the code when suggesting fixes."""),
-            ("user", """
-            Full Log File Analysis:
-            ----------------------
-            Total Errors: {total_errors}
-            
-            Errors By Type:
-            {error_type_summary}
-            
-            Errors By File:
-            {file_summary}
-            
-            Sample Source Code:
-            {file_content_samples}
-            
-            Raw Log Data (Sample):
-            {raw_log}
-            
-            Provide your comprehensive analysis and solution recommendations:
-            """)
-        ])
-
-        comprehensive_chain = (
-            {
-                "total_errors": lambda x: pattern_analysis['total_errors'],
-                "error_type_summary": lambda x: "\n".join(error_summaries),
-                "file_summary": lambda x: "\n".join(file_summaries),
-                "file_content_samples": lambda x: "\n\n".join(file_content_samples),
-                "raw_log": lambda x: pattern_analysis['full_log'][:2000]
-            }
-            | comprehensive_prompt
-            | self.llm
-            | StrOutputParser()
-        )
+        analysis = self._comprehensive_chain.invoke({
+            "total_errors": pattern_analysis['total_errors'],
+            "error_type_summary": "\n".join(error_summaries),
+            "file_summary": "\n".join(file_summaries),
+            "file_content_samples": "\n\n".join(file_content_samples),
+            "raw_log": pattern_analysis['full_log'][:2000]
+        })
 
         return {
-            'analysis': comprehensive_chain.invoke({}),
+            'analysis': analysis,
             'pattern_analysis': pattern_analysis
         }
 
     def get_file_recommendations(self, error_analysis: Dict) -> Dict[str, str]:
         """Generate file-specific fix recommendations."""
-        file_fixes = {}
-        
+        inputs = []
         for file_path, errors in error_analysis['pattern_analysis']['error_by_file'].items():
             if len(errors) >= 1:
                 file_content = self.get_file_content(file_path)
                 if not file_content:
                     continue
-                    
-                try:
-                    file_prompt = ChatPromptTemplate.from_messages([
-                        ("system", """You are an expert software engineer.
-                        Based on the multiple errors in this file, provide a comprehensive fix that addresses all issues.
-                        Focus on the most efficient solution that solves the underlying problems.
-                        Return the updated full file content with all necessary changes.
-                        And please give only python code no need to give any extra symbols or words like python.
-                        **EXAMPLE**
-                         -WRONG FORMAT:
-                         ```python
-                            code
-                         ```
-                          
-                        Add comments where you've made changes to explain what issues each change addresses."""),
-                        ("user", """
-                        File Path: {file_path}
-                        
-                        Errors in this file:
-                        {errors}
-                        
-                        Original File Content:
-                        {file_content}
-                        
-                        Provide the completely updated file content with all fixes applied:
-                        """)
-                    ])
-                    
-                    file_chain = (
-                        {
-                            "file_path": lambda x: file_path,
-                            "errors": lambda x: str(errors),
-                            "file_content": lambda x: file_content
-                        }
-                        | file_prompt
-                        | self.llm
-                        | StrOutputParser()
-                    )
-                    
-                    file_fixes[file_path] = file_chain.invoke({})
-                except Exception as e:
-                    console.print(f"[red]Error generating fix for {file_path}: {str(e)}[/red]")
+                inputs.append({
+                    "file_path": file_path,
+                    "errors": str(errors),
+                    "file_content": file_content
+                })
+        
+        # One request per file, run concurrently; a failed file doesn't sink the others
+        results = self._file_fix_chain.batch(
+            inputs,
+            config={"max_concurrency": LLM_MAX_CONCURRENCY},
+            return_exceptions=True
+        )
+        
+        file_fixes = {}
+        for file_input, result in zip(inputs, results):
+            file_path = file_input["file_path"]
+            if isinstance(result, Exception):
+                console.print(f"[red]Error generating fix for {file_path}: {str(result)}[/red]")
+            else:
+                file_fixes[file_path] = result
         
         return file_fixes
 
     def basic_log_review(self, log_file: str) -> bool:
         """Perform basic log review with error analysis and possible causes."""
         try:
-            with open(log_file, 'r') as f:
+            with open(log_file, 'r', errors='replace') as f:
                 log_content = f.read()
                 
             errors = self.extract_errors(log_file)
@@ -423,41 +615,20 @@ class LogAnalyzer:
             
             # Analyze each error type
             console.print("\n[bold]Error Analysis:[/bold]")
-            for error_type, count in sorted(error_summary.items(), key=lambda x: x[1], reverse=True):
-                # Get analysis for this error type
-                analysis_prompt = ChatPromptTemplate.from_messages([
-                    ("system", """You are an expert software engineer analyzing error logs. For the given error type, provide:
-                    1. What this error typically means
-                    2. Common causes for this error
-                    3. General recommendations to fix it
-                    
-                    Be concise but helpful. Don't reference specific files since we only have log data.
-                    Format your response with clear bullet points."""),
-                    ("user", """
-                    Error Type: {error_type}
-                    Sample Error Message: {sample_message}
-                    Sample Traceback: {sample_traceback}
-                    
-                    Please analyze this error:
-                    """)
-                ])
-                
-                # Find a sample error of this type
+            # One input per error type, using the first error of that type as the sample
+            sorted_types = sorted(error_summary.items(), key=lambda x: x[1], reverse=True)
+            analysis_inputs = []
+            for error_type, _ in sorted_types:
                 sample_error = next((e for e in errors if e.get('error_type') == error_type), None)
-                custom_llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-                analysis_chain = (
-                    {
-                        "error_type": lambda x: error_type,
-                        "sample_message": lambda x: sample_error.get('error_message', 'No message') if sample_error else 'No message',
-                        "sample_traceback": lambda x: sample_error.get('full_traceback', 'No traceback')[:500] if sample_error else 'No traceback'
-                    }
-                    | analysis_prompt
-                    | custom_llm
-                    | StrOutputParser()
-                )
-                
-                analysis = analysis_chain.invoke({})
-                
+                analysis_inputs.append({
+                    "error_type": error_type,
+                    "sample_message": sample_error.get('error_message', 'No message') if sample_error else 'No message',
+                    "sample_traceback": sample_error.get('full_traceback', 'No traceback')[:500] if sample_error else 'No traceback'
+                })
+            
+            # The calls are independent, so run them concurrently and print in order
+            analyses = self._analysis_chain.batch(analysis_inputs, config={"max_concurrency": LLM_MAX_CONCURRENCY})
+            for (error_type, count), analysis in zip(sorted_types, analyses):
                 console.print(Panel.fit(
                     f"[bold]{error_type}[/bold] (occurred {count} times)\n{analysis}",
                     border_style="yellow"
@@ -465,48 +636,24 @@ class LogAnalyzer:
             
             # Show sample error details with analysis
             console.print("\n[bold]Sample Error Details with Analysis:[/bold]")
-            for i, error in enumerate(errors[:3], 1):  # Show first 3 errors with detailed analysis
+            detail_errors = errors[:3]  # Show first 3 errors with detailed analysis
+            detailed_analyses = self._detailed_chain.batch([
+                {
+                    "error_type": error.get('error_type', 'Unknown'),
+                    "file_path": error.get('file_path', 'Unknown'),
+                    "line_number": error.get('line_number', 'Unknown'),
+                    "error_message": error.get('error_message', 'No message'),
+                    "traceback": error.get('full_traceback', 'No traceback')[:1000]
+                }
+                for error in detail_errors
+            ], config={"max_concurrency": LLM_MAX_CONCURRENCY})
+            
+            for i, (error, detailed_analysis) in enumerate(zip(detail_errors, detailed_analyses), 1):
                 console.print(f"\n[i]{i}. [red]{error.get('error_type', 'Unknown')}[/red][/i]")
                 console.print(f"   File: {error.get('file_path', 'Unknown')}")
                 console.print(f"   Line: {error.get('line_number', 'Unknown')}")
                 console.print(f"   Message: {error.get('error_message', 'No message')}")
                 
-                # Get detailed analysis for this specific error
-                detailed_prompt = ChatPromptTemplate.from_messages([
-                    ("system", """You are debugging an application. Analyze this specific error and provide:
-                    1. What likely caused this specific error
-                    2. Possible solutions based on the traceback
-                    3. Recommended troubleshooting steps
-                    
-                    Be specific but don't reference code you can't see.
-                    Format with clear sections."""),
-                    ("user", """
-                    Error Type: {error_type}
-                    File: {file_path}
-                    Line: {line_number}
-                    Message: {error_message}
-                    Traceback:
-                    {traceback}
-                    
-                    Detailed analysis:
-                    """)
-                ])
-                
-                detailed_chain = (
-                    {
-                        "error_type": lambda x: error.get('error_type', 'Unknown'),
-                        "file_path": lambda x: error.get('file_path', 'Unknown'),
-                        "line_number": lambda x: error.get('line_number', 'Unknown'),
-                        "error_message": lambda x: error.get('error_message', 'No message'),
-                        "traceback": lambda x: error.get('full_traceback', 'No traceback')[:1000]
-                    }
-                    | detailed_prompt
-                    | self.llm
-                    | StrOutputParser()
-                )
-                
-                detailed_analysis = detailed_chain.invoke({})
-                
                 console.print(Panel.fit(
                     detailed_analysis,
                     border_style="blue"
@@ -515,40 +662,15 @@ class LogAnalyzer:
             # General recommendations for all errors
             if len(errors) > 0:
                 console.print("\n[bold]General Recommendations:[/bold]")
-                rec_prompt = ChatPromptTemplate.from_messages([
-                    ("system", """Based on the collection of errors found, provide:
-                    1. Common patterns you notice
-                    2. Recommended next steps for debugging
-                    3. Potential system-wide improvements
-                    
-                    Focus on actionable advice that doesn't require source code access."""),
-                    ("user", """
-                    Errors Found:
-                    {error_summary}
-                    
-                    Sample Errors:
-                    {sample_errors}
-                    
-                    Recommendations:
-                    """)
-                ])
-                
                 sample_errors = "\n".join(
                     f"{e.get('error_type')}: {e.get('error_message')}" 
                     for e in errors[:5]  # Use first 5 errors as sample
                 )
                 
-                rec_chain = (
-                    {
-                        "error_summary": lambda x: "\n".join(f"{k}: {v} occurrences" for k,v in error_summary.items()),
-                        "sample_errors": lambda x: sample_errors
-                    }
-                    | rec_prompt
-                    | self.llm
-                    | StrOutputParser()
-                )
-                
-                recommendations = rec_chain.invoke({})
+                recommendations = self._rec_chain.invoke({
+                    "error_summary": "\n".join(f"{k}: {v} occurrences" for k,v in error_summary.items()),
+                    "sample_errors": sample_errors
+                })
                 
                 console.print(Panel.fit(
                     recommendations,
@@ -569,7 +691,7 @@ class LogAnalyzer:
         console.print("[cyan]Performing in-depth analysis with code context...[/cyan]")
         
         try:
-            with open(log_file, 'r') as f:
+            with open(log_file, 'r', errors='replace') as f:
                 log_content = f.read()
                 
             errors = self.extract_errors(log_file)
@@ -625,10 +747,10 @@ class LogAnalyzer:
                     try:
                         actual_path = self.find_file(file_path)
                         if actual_path:
-                            with open(actual_path, 'w') as f:
+                            with open(actual_path, 'w', encoding='utf-8', errors='surrogateescape') as f:
                                 f.write(fix)
                             console.print(f"[green]Comprehensive fix applied to {file_path}![/green]")
-                            self.file_cache[file_path] = fix
+                            self._cache_file(file_path, fix)
                     except Exception as e:
                         console.print(f"[red]Error applying fix: {str(e)}[/red]")
             
@@ -641,6 +763,19 @@ class LogAnalyzer:
             return False
 
 
+def _grep_file(file_path: str, pattern: re.Pattern) -> bool:
+    """Check whether a file matches a bytes pattern, mapping it instead of reading it."""
+    try:
+        with open(file_path, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return pattern.search(b'') is not None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return pattern.search(mm) is not None
+    except (OSError, ValueError):
+        return False
+
+
 @click.command()
 @click.option('--log-file', '-f', type=click.Path(exists=True), help='Specific log file to analyze')
 @click.option('--directory', '-d', type=click.Path(exists=True), default='.', help='Directory to search for log files')
@@ -648,7 +783,8 @@ class LogAnalyzer:
 @click.option('--max-depth', type=int, default=4, help='Maximum depth for recursive search')
 @click.option('--extensions', '-e', multiple=True, default=['.log', '.txt'], help='Log file extensions to search for')
 @click.option('--grep', '-g', help='Filter log files containing specific pattern (uses grep-like functionality)')
-def main(log_file, directory, recursive, max_depth, extensions, grep):
+@click.option('--include-hidden', is_flag=True, help='Also search hidden directories when searching recursively')
+def main(log_file, directory, recursive, max_depth, extensions, grep, include_hidden):
     """Analyze log files and provide AI-powered solutions."""
     analyzer = LogAnalyzer()
     
@@ -663,33 +799,24 @@ def main(log_file, directory, recursive, max_depth, extensions, grep):
         log_files = [log_file]
     elif recursive:
         console.print(f"[cyan]Searching for log files in {directory} (recursive, max depth: {max_depth})...[/cyan]")
-        log_files = analyzer.find_log_files(directory, extensions, max_depth)
+        log_files = analyzer.find_log_files(directory, extensions, max_depth, include_hidden)
     else:
         console.print(f"[cyan]Searching for log files in {directory} (non-recursive)...[/cyan]")
-        try:
-            for item in os.listdir(directory):
-                item_path = os.path.join(directory, item)
-                if os.path.isfile(item_path):
-                    _, ext = os.path.splitext(item_path)
-                    if ext.lower() in extensions and analyzer._is_likely_log_file(item_path):
-                        log_files.append(item_path)
-        except Exception as e:
-            console.print(f"[red]Error accessing directory {directory}: {e}[/red]")
+        log_files = analyzer.find_log_files(directory, extensions, max_depth=1)
     
     if grep and log_files:
-        filtered_files = []
+        try:
+            grep_re = re.compile(grep.encode())
+        except re.error as e:
+            console.print(f"[red]Invalid grep pattern {grep!r}: {e}[/red]")
+            return
+        
         console.print(f"[cyan]Filtering log files containing pattern: {grep}[/cyan]")
         
-        for file_path in log_files:
-            try:
-                with open(file_path, 'r') as f:
-                    content = f.read()
-                    if re.search(grep, content):
-                        filtered_files.append(file_path)
-            except Exception:
-                pass
-                
-        log_files = filtered_files
+        # Scanning is I/O-bound, so fan it out across threads; map keeps file order
+        with ThreadPoolExecutor(max_workers=min(32, len(log_files))) as executor:
+            matches = executor.map(lambda path: _grep_file(path, grep_re), log_files)
+            log_files = [path for path, matched in zip(log_files, matches) if matched]
     
     if not log_files:
         console.print("[yellow]No log files found.[/yellow]")
@@ -697,17 +824,26 @@ def main(log_file, directory, recursive, max_depth, extensions, grep):
     
     console.print(f"[green]Found {len(log_files)} log file(s).[/green]")
     
-    table = Table(title="Found Log Files")
-    table.add_column("Index", style="cyan")
-    table.add_column("Log File", style="magenta")
-    table.add_column("Size", style="blue")
-    
+    rows = []
     for i, file_path in enumerate(log_files, 1):
-        size = os.path.getsize(file_path)
+        size = analyzer.file_sizes.get(file_path)
+        if size is None:
+            size = os.path.getsize(file_path)
         size_str = f"{size / 1024:.2f} KB" if size < 1024 * 1024 else f"{size / (1024 * 1024):.2f} MB"
-        table.add_row(str(i), file_path, size_str)
+        rows.append((str(i), file_path, size_str))
     
-    console.print(table)
+    if len(rows) > TABLE_MAX_ROWS:
+        # Rich tables render slowly at this size, so print plain lines instead
+        console.print("\n".join(f"{i:>4}  {size_str:>10}  {file_path}" for i, file_path, size_str in rows),
+                      markup=False, highlight=False)
+    else:
+        table = Table(title="Found Log Files")
+        table.add_column("Index", style="cyan")
+        table.add_column("Log File", style="magenta")
+        table.add_column("Size", style="blue")
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
     
     # Define review mode options with descriptions
     review_modes = {
@@ -1,7 +1,28 @@
 import streamlit as st
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-import pandas as pd
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _build_trend_fig(trend_data: tuple) -> go.Figure:
+    """Build the 24-hour error trend chart; the short TTL keeps its time axis current."""
+    now = datetime.now()
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=[now - timedelta(hours=i) for i in range(24)],
+        y=list(trend_data),
+        mode='lines',
+        name='Error Count',
+        line=dict(color='#dc3545')
+    ))
+    fig.update_layout(
+        height=200,
+        margin=dict(l=0, r=0, t=0, b=0),
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        xaxis=dict(showgrid=False),
+        yaxis=dict(showgrid=True, gridcolor='#eee')
+    )
+    return fig
 
 def show_error_resolution(error_type: str, details: dict, ai_analysis: dict):
     """Display detailed error resolution page with AI analysis."""
@@ -77,26 +98,7 @@ def show_error_resolution(error_type: str, details: dict, ai_analysis: dict):
         
         # Error Trend
         st.subheader("Error Trend")
-        error_trend = pd.DataFrame({
-            'timestamp': [datetime.now() - timedelta(hours=i) for i in range(24)],
-            'count': details.get('trend_data', [0] * 24)
-        })
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=error_trend['timestamp'],
-            y=error_trend['count'],
-            mode='lines',
-            name='Error Count',
-            line=dict(color='#dc3545')
-        ))
-        fig.update_layout(
-            height=200,
-            margin=dict(l=0, r=0, t=0, b=0),
-            paper_bgcolor='rgba(0,0,0,0)',
-            plot_bgcolor='rgba(0,0,0,0)',
-            xaxis=dict(showgrid=False),
-            yaxis=dict(showgrid=True, gridcolor='#eee')
-        )
+        fig = _build_trend_fig(tuple(details.get('trend_data', [0] * 24)))
         st.plotly_chart(fig, use_container_width=True)
 
     # Action Buttons
@@ -2,6 +2,20 @@ import streamlit as st
 import pandas as pd
 from datetime import datetime
 
+# Cell styles for the Level column
+_LEVEL_STYLE = {
+    'ERROR': 'background-color: #ffebee; color: #c62828',
+    'WARNING': 'background-color: #fff3e0; color: #ef6c00',
+    'INFO': 'background-color: #e3f2fd; color: #1565c0'
+}
+# Rows sent to the browser per page of the log table
+PAGE_SIZE = 500
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _logs_to_csv(logs: list) -> bytes:
+    """Render logs as CSV bytes, reused across reruns while the logs are unchanged."""
+    return pd.DataFrame(logs).to_csv(index=False).encode()
+
 def show_log_explorer(logs: list):
     """Display the log explorer interface."""
     st.title("Log Explorer")
@@ -22,37 +36,41 @@ def show_log_explorer(logs: list):
         with col4_2:
             st.download_button(
                 "Export",
-                data=pd.DataFrame(logs).to_csv(index=False),
+                data=_logs_to_csv(logs),
                 file_name="logs.csv",
                 mime="text/csv"
             )
 
-    # Apply filters
-    filtered_logs = logs
-    if search_query:
-        filtered_logs = [log for log in filtered_logs if search_query.lower() in log['message'].lower()]
-    if log_level != "All Levels":
-        filtered_logs = [log for log in filtered_logs if log['level'].upper() == log_level]
-    if source != "All Sources":
-        filtered_logs = [log for log in filtered_logs if log['service'] == source.lower()]
+    # Apply filters as vectorized masks over a single DataFrame
+    df = pd.DataFrame(logs)
+    if not df.empty:
+        mask = pd.Series(True, index=df.index)
+        if search_query:
+            mask &= df['message'].str.contains(search_query, case=False, regex=False, na=False)
+        if log_level != "All Levels":
+            mask &= df['level'].str.upper() == log_level
+        if source != "All Sources":
+            mask &= df['service'] == source.lower()
+        df = df.loc[mask]
 
     # Display logs in a table
-    if filtered_logs:
-        df = pd.DataFrame(filtered_logs)
+    if not df.empty:
         df = df[['timestamp', 'level', 'service', 'message']]
         df.columns = ['Timestamp', 'Level', 'Service', 'Message']
         
-        # Style the dataframe
-        def highlight_level(val):
-            if val == 'ERROR':
-                return 'background-color: #ffebee; color: #c62828'
-            elif val == 'WARNING':
-                return 'background-color: #fff3e0; color: #ef6c00'
-            elif val == 'INFO':
-                return 'background-color: #e3f2fd; color: #1565c0'
-            return ''
+        # Only the current page is styled and sent to the browser
+        total_pages = max(1, (len(df) + PAGE_SIZE - 1) // PAGE_SIZE)
+        page = 1
+        if total_pages > 1:
+            # Narrower filters can leave the remembered page past the end
+            if st.session_state.get("log_explorer_page", 1) > total_pages:
+                st.session_state["log_explorer_page"] = total_pages
+            page = st.number_input(f"Page (of {total_pages})", min_value=1, max_value=total_pages,
+                                   key="log_explorer_page")
+        page_df = df.iloc[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
         
-        styled_df = df.style.applymap(highlight_level, subset=['Level'])
+        # Style the level column in one vectorized map
+        styled_df = page_df.style.apply(lambda col: col.map(_LEVEL_STYLE).fillna(''), subset=['Level'])
         st.dataframe(styled_df, use_container_width=True)
     else:
         st.info("No logs found matching the filters.") 
\ No newline at end of file
@@ -1,10 +1,32 @@
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import os
 from typing import List, Dict
 import re
 from urllib.parse import urljoin
 
+# Level and service in one alternation, compiled once, so query_range scans
+# each log line a single time. The service name is captured in a lookahead so
+# a level word inside it is still seen, as with separate searches
+_LOG_FIELDS_RE = re.compile(r'(?P<level>ERROR|WARNING|INFO|DEBUG|CRITICAL)|services\.(?=(?P<svc>\w+))')
+
+_TS_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+def _parse_level_service(message: str):
+    """Return the first log level and service name in a message, or None for either."""
+    level = service = None
+    for match in _LOG_FIELDS_RE.finditer(message):
+        if match.lastgroup == 'level':
+            level = level or match.group('level')
+        else:
+            service = service or match.group('svc')
+        if level and service:
+            break
+    return level, service
+
 class LokiClient:
     def __init__(self):
         self.base_url = os.getenv('LOKI_URL', 'http://localhost:3100')
@@ -12,6 +34,19 @@ class LokiClient:
         self.password = os.getenv('LOKI_PASSWORD')
         self.verify_ssl = os.getenv('LOKI_VERIFY_SSL', 'true').lower() == 'true'
         
+        # One pooled session, so repeat queries reuse the connection (and TLS handshake)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        self._session.auth = self.get_auth()
+        self._session.headers.update(self.get_headers())
+        self._session.verify = self.verify_ssl
+        
     def get_auth(self):
         """Get authentication tuple if credentials are provided."""
         if self.username and self.password:
@@ -23,6 +58,8 @@ class LokiClient:
         return {
             'Content-Type': 'application/json',
             'Accept': 'application/json',
+            # Log JSON compresses well; requests decompresses transparently
+            'Accept-Encoding': 'gzip, deflate',
         }
     
     def query_range(self, query: str, start_time: datetime, end_time: datetime, limit: int = 1000) -> List[Dict]:
@@ -37,37 +74,32 @@ class LokiClient:
         }
         
         try:
-            response = requests.get(
-                url,
-                params=params,
-                headers=self.get_headers(),
-                auth=self.get_auth(),
-                verify=self.verify_ssl
-            )
+            response = self._session.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             logs = []
+            from_ts = datetime.fromtimestamp
+            parse_fields = _parse_level_service
             for stream in data.get('data', {}).get('result', []):
                 labels = stream.get('stream', {})
-                for value in stream.get('values', []):
-                    timestamp = datetime.fromtimestamp(float(value[0])/1e9)
-                    message = value[1]
-                    
-                    # Extract log level and service from message
-                    level_match = re.search(r'(ERROR|WARNING|INFO|DEBUG|CRITICAL)', message)
-                    service_match = re.search(r'services\.(\w+)', message)
-                    
-                    log_entry = {
-                        'timestamp': timestamp.strftime('%Y-%m-%d %H:%M:%S'),
-                        'message': message,
-                        'level': level_match.group(1).lower() if level_match else 'info',
-                        'service': service_match.group(1) if service_match else labels.get('service', 'unknown'),
+                default_service = labels.get('service', 'unknown')
+                # Timestamps are nanosecond strings; whole seconds are all the format shows
+                logs.extend(
+                    {
+                        'timestamp': from_ts(int(value[0]) // 1_000_000_000).strftime(_TS_FORMAT),
+                        'message': value[1],
+                        'level': level.lower() if level else 'info',
+                        'service': service or default_service,
                         'labels': labels
                     }
-                    logs.append(log_entry)
+                    for value in stream.get('values', [])
+                    for level, service in (parse_fields(value[1]),)
+                )
             
             return logs
+        except orjson.JSONDecodeError as e:
+            raise Exception(f"An error occurred while querying Loki: {str(e)}")
         except requests.exceptions.RequestException as e:
             if isinstance(e, requests.exceptions.ConnectionError):
                 raise Exception(f"Failed to connect to Loki at {self.base_url}. Please check if Loki is running and accessible.")
@@ -83,12 +115,7 @@ class LokiClient:
         """Test the connection to Loki."""
         try:
             url = urljoin(self.base_url, "/loki/api/v1/labels")
-            response = requests.get(
-                url,
-                headers=self.get_headers(),
-                auth=self.get_auth(),
-                verify=self.verify_ssl
-            )
+            response = self._session.get(url)
             response.raise_for_status()
             return True
         except:
@@ -5,8 +5,18 @@ from .loki_client import LokiClient
 import json
 from datetime import datetime
 import re
+from collections import Counter
 import pandas as pd
 
+# Timestamp, level and service read by one pandas str.extract over all lines.
+# Each field sits in its own optional lookahead from the line start, so each
+# gets its first occurrence independently, as with separate searches
+_LOG_FIELDS_RE = re.compile(
+    r'^(?=(?:.*?\[(?P<timestamp>[^\]\n]*)\])?)'
+    r'(?=(?:.*?(?P<level>ERROR|WARNING|INFO|DEBUG|CRITICAL))?)'
+    r'(?=(?:.*?services\.(?P<service>\w+))?)'
+)
+
 def save_loki_config(url: str, username: str = None, password: str = None, verify_ssl: bool = True):
     """Save Loki configuration to environment variables and session state."""
     # Save to environment variables
@@ -16,6 +26,10 @@ def save_loki_config(url: str, username: str = None, password: str = None, verif
     if password:
         os.environ['LOKI_PASSWORD'] = password
     os.environ['LOKI_VERIFY_SSL'] = str(verify_ssl).lower()
+    # Clients read the config on construction, and the password isn't part of
+    # the probe's cache key, so drop both
+    st.session_state.pop('_loki_client', None)
+    _probe_loki.clear()
     
     # Save to session state
     if 'loki_config' not in st.session_state:
@@ -27,10 +41,25 @@ def save_loki_config(url: str, username: str = None, password: str = None, verif
         'is_configured': True
     })
 
+def _get_loki_client() -> LokiClient:
+    """Get this session's LokiClient, creating it on first use."""
+    client = st.session_state.get('_loki_client')
+    if client is None:
+        client = st.session_state['_loki_client'] = LokiClient()
+    return client
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _probe_loki(url: str, username: str, verify_ssl: bool) -> bool:
+    """Probe Loki for the configuration given by the arguments, which form the cache key."""
+    return _get_loki_client().test_connection()
+
 def test_loki_connection() -> bool:
-    """Test connection to Loki server."""
-    client = LokiClient()
-    return client.test_connection()
+    """Test connection to Loki server, probing at most every 30 seconds per configuration."""
+    return _probe_loki(
+        os.getenv('LOKI_URL', 'http://localhost:3100'),
+        os.getenv('LOKI_USERNAME'),
+        os.getenv('LOKI_VERIFY_SSL', 'true').lower() == 'true'
+    )
 
 def process_uploaded_logs(uploaded_file) -> List[Dict]:
     """Process uploaded log file."""
@@ -39,21 +68,16 @@ def process_uploaded_logs(uploaded_file) -> List[Dict]:
         if uploaded_file.type == "application/json":
             logs = json.loads(content)
         else:  # Assume text file with one log per line
-            logs = []
-            for line in content.decode().split('\n'):
-                if line.strip():
-                    # Extract timestamp, level, and message using regex
-                    timestamp_match = re.search(r'\[(.*?)\]', line)
-                    level_match = re.search(r'(ERROR|WARNING|INFO|DEBUG|CRITICAL)', line)
-                    service_match = re.search(r'services\.(\w+)', line)
-                    
-                    log_entry = {
-                        'timestamp': timestamp_match.group(1) if timestamp_match else datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                        'message': line.strip(),
-                        'level': level_match.group(1).lower() if level_match else 'info',
-                        'service': service_match.group(1) if service_match else 'unknown'
-                    }
-                    logs.append(log_entry)
+            lines = pd.Series(content.decode().split('\n'))
+            lines = lines[lines.str.strip().str.len() > 0]
+            
+            # Extract timestamp, level, and service for every line in one vectorized pass
+            fields = lines.str.extract(_LOG_FIELDS_RE)
+            fields['timestamp'] = fields['timestamp'].fillna(datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+            fields['message'] = lines.str.strip()
+            fields['level'] = fields['level'].str.lower().fillna('info')
+            fields['service'] = fields['service'].fillna('unknown')
+            logs = fields[['timestamp', 'message', 'level', 'service']].to_dict('records')
         return logs
     except Exception as e:
         st.error(f"Error processing log file: {str(e)}")
@@ -120,20 +144,18 @@ def show_sources():
                 
                 # Test query
                 try:
-                    client = LokiClient()
+                    client = _get_loki_client()
                     logs = client.fetch_logs("Last 24 hours", default_query)
                     if logs:
                         st.success(f"Successfully fetched {len(logs)} logs")
                         # Update the dashboard state with the fetched logs
                         st.session_state.log_data['log_entries'] = logs
                         # Update metrics
-                        error_count = sum(1 for log in logs if log['level'] in ['error', 'critical'])
-                        warning_count = sum(1 for log in logs if log['level'] == 'warning')
-                        info_count = sum(1 for log in logs if log['level'] == 'info')
+                        level_counts = Counter(log['level'] for log in logs)
                         st.session_state.log_data.update({
-                            'errors': error_count,
-                            'warnings': warning_count,
-                            'info': info_count
+                            'errors': level_counts['error'] + level_counts['critical'],
+                            'warnings': level_counts['warning'],
+                            'info': level_counts['info']
                         })
                     else:
                         st.warning("No logs found with the default query")
@@ -0,0 +1,20 @@
+import pytest
+
+for module in ('click', 'dotenv', 'langchain', 'rich'):
+    pytest.importorskip(module)
+
+from agent.cli import _build_prompt_content
+
+
+@pytest.mark.parametrize('line_count, line_length, line_number', [
+    (300, 400, 150),   # window overlaps the header and is over budget
+    (300, 400, 30),
+    (300, 400, 300),
+    (2000, 60, 1000),  # header plus window fits the budget
+    (2000, 400, 1000),  # window alone is over budget
+    (50, 10, 25),      # whole file fits
+])
+def test_prompt_content_contains_error_line(line_count, line_length, line_number):
+    lines = [f'{i:06d}|' + 'x' * line_length for i in range(line_count)]
+    content = _build_prompt_content(lines, line_number)
+    assert lines[line_number - 1] in content